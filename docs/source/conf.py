@@ -27,6 +27,13 @@ exclude_patterns = []
 
 todo_include_todos = True
 
+# Prefix auto-generated section labels with the document name so that
+# same-titled sections in different pages don't collide across incremental builds
+autosectionlabel_prefix_document = True
+
+# Recommended build (parallel, incremental doctrees): `make html` in docs/, i.e.
+# sphinx-build -j auto -b html -d build/doctrees source build/html
+
 
 # -- Options for HTML output -------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
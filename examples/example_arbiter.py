@@ -1,33 +1,47 @@
 # example_arbiter.py
 
-from wdmsim.arbiter.base_arbiter import BaseArbiter
+from wdmsim.arbiter.base_arbiter import BaseArbiter, ArbiterStepper
 from wdmsim.arbiter.arbiter_factory import arbiter_factory
 from wdmsim.arbiter.arbiter_instr import SearchInst, LockInst, UnlockInst
 
+# state machine for the one-by-one lock sequence
+# each step issues LockInst to one slice, and the step after the last slice sets end_state
+class OneByOneStepper(ArbiterStepper):
+    def __init__(self, arbiter: BaseArbiter):
+        super().__init__(arbiter)
+
+        # set lock sequence before start running an algorithm
+        # slices are locked in index order regardless of the target lane order
+        # (the target lane order is checked after the sequence by the system under test)
+        self._seq = range(arbiter.num_slices)
+        self._i = 0
+
+    def step(self):
+        arbiter = self.arbiter
+        i = self._i
+        num_steps = len(self._seq)
+
+        if i < num_steps:
+            # issue LockInst to the slice and flag an error if it failed to lock
+            rx_idx = self._seq[i]
+            LockInst(arbiter, rx_idx, "least_significant", 0).run()
+            if not (arbiter.check_lock_done(rx_idx) and not arbiter.check_zero_lock(rx_idx)):
+                arbiter.lock_error_state = True
+        elif i == num_steps:
+            # if the sequence is done and not in error state, set end_state to True
+            arbiter.end_state = True
+        else:
+            return False
+
+        self._i = i + 1
+        return True
+
+
 # register the arbiter class to the factory
 # the register_str_id is the string id that will be used to refer to this arbiter in the CLI
 @arbiter_factory(register_str_id="example_one_by_one")
 class SimpleArbiter(BaseArbiter):
     # override algorithm function to implement the arbiter algorithm
+    # it can either be a generator that yields at every lock-step or return an ArbiterStepper
     def algorithm(self):
-        # set lock sequence before start running an algorithm
-        if self.target_lane_order:
-            slice_lock_sequence = [self.target_lane_order.index(lane) for lane in self.target_lane_order]
-        else:
-            slice_lock_sequence = list(range(self.num_slices))
-
-        # loop through the lock sequence and issue LockInst to each slice
-        # for each iteration, yield to update the lock-step
-        for rx_idx in slice_lock_sequence:
-            LockInst(self, rx_idx, "least_significant", 0).run()
-            if self.check_lock_done(rx_idx) and not self.check_zero_lock(rx_idx):
-                yield
-            else:
-                self.lock_error_state = True
-                yield
-
-        # if the sequence is done and not in error state, set end_state to True
-        self.end_state = True
-        yield
-
-
+        return OneByOneStepper(self)
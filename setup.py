@@ -7,24 +7,17 @@
     PyScaffold helps you to put up the scaffold of your new Python project.
     Learn more under: https://pyscaffold.org/
 """
-from typing import List
+from typing import List, Optional
 import os
+import sysconfig
 from pathlib import Path
 from setuptools import setup
-from pybind11.setup_helpers import Pybind11Extension, build_ext
 
 # Discover arbiters from the environment variable
-def get_wdmsim_arbiter_path() -> List[Path]:
-    path_separator = ":" if os.name != "nt" else ";"
-    def parse_env_var(env_var: str) -> List[str]:
-        if env_var.find(path_separator) != -1:
-            return env_var.split(path_separator)
-        else:
-            return [env_var]
-        
+def get_wdmsim_arbiter_path() -> Optional[List[Path]]:
     arb_path_env_var = os.environ.get("WDMSIM_ARBITER_PATH", "")
-    if arb_path_env_var != "":
-        return [Path(p) for p in parse_env_var(arb_path_env_var)]
+    if arb_path_env_var:
+        return [Path(p) for p in arb_path_env_var.split(os.pathsep) if p]
     else:
         return None
 
@@ -35,27 +28,38 @@ if __name__ == "__main__":
         # setup()
 
         parsed_arbiter_path = get_wdmsim_arbiter_path()
+        ext_modules = []
+        cmdclass = {}
         if parsed_arbiter_path:
             # setup with pybind cpp extension
-            for arbiter_path in parsed_arbiter_path:
-                ext_modules = []
+            # pybind11 is only needed (and imported) when there are arbiter paths to build from
+            from pybind11.setup_helpers import ParallelCompile, Pybind11Extension, build_ext
+            cmdclass["build_ext"] = build_ext
+
+            # compile extensions in parallel (NPY_NUM_BUILD_JOBS, defaults to all cores)
+            ParallelCompile("NPY_NUM_BUILD_JOBS", default=0).install()
 
-                # detect cpp files in the arbiter path
-                for cpp_file in arbiter_path.glob("*.cpp"):
-                    ext_modules.append(
-                        Pybind11Extension(
-                            f"{arbiter_path.stem}.{cpp_file.stem}",
-                            [cpp_file.relative_to(os.getcwd())],
-                            # [cpp_file.absolute()],
-                        )
+            # route compilers through ccache if $CCACHE is set (e.g. CCACHE=ccache)
+            ccache = os.environ.get("CCACHE")
+            if ccache:
+                for compiler_var in ("CC", "CXX"):
+                    compiler = os.environ.get(compiler_var) or sysconfig.get_config_var(compiler_var)
+                    if compiler and not compiler.startswith(ccache):
+                        os.environ[compiler_var] = f"{ccache} {compiler}"
+
+            # detect cpp files in all the arbiter paths
+            for arbiter_path in parsed_arbiter_path:
+                ext_modules.extend(
+                    Pybind11Extension(
+                        f"{arbiter_path.stem}.{cpp_file.stem}",
+                        [str(cpp_file.relative_to(os.getcwd()))],
                     )
+                    for cpp_file in arbiter_path.glob("*.cpp")
+                )
 
-        else:
-            ext_modules = []
-            
         setup(
             ext_modules=ext_modules,
-            cmdclass={"build_ext": build_ext},
+            cmdclass=cmdclass,
         )
 
     except:  # noqa
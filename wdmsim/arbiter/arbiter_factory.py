@@ -1,7 +1,8 @@
 
-from typing import Dict, List
+from typing import Dict, List, Set
 from pathlib import Path
-import importlib
+import ast
+import importlib.util
 import sys
 import os
 import inspect
@@ -13,12 +14,12 @@ logger = logging.getLogger(__name__)
 
 arbiter_registry : Dict[str, BaseArbiter] = BaseArbiter._registry
 
+# resolved paths of arbiter modules already executed by discover_arbiter_modules
+_discovered : Set[str] = set()
+
 def arbiter_factory(register_str_id: str):
-    def register(arb_cls: BaseArbiter):
-        # arb_cls.__init_subclass__(register_str_id=register_str_id)
-        arbiter_registry[register_str_id] = arb_cls
-        return arb_cls
-    return register
+    # same as BaseArbiter.register, kept as the documented decorator
+    return BaseArbiter.register(register_str_id)
 
 """
 Auto-discovery method
@@ -26,6 +27,39 @@ Auto-discovery method
 def _is_arbiter_class(cls):
     return inspect.isclass(cls) and issubclass(cls, BaseArbiter) and cls != BaseArbiter
 
+def _attr_name(node) -> str:
+    # name of a Name/Attribute node, e.g. BaseArbiter for base_arbiter.BaseArbiter
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ""
+
+def _declares_arbiter(module_path: str) -> bool:
+    """Cheap AST prescan for an arbiter class declaration
+    Returns True if the module defines a class deriving from BaseArbiter or decorated with
+    arbiter_factory / BaseArbiter.register, so helper modules are not executed at discovery
+
+    :param module_path: The path of the module to prescan
+    """
+    try:
+        with open(module_path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=module_path)
+    except SyntaxError:
+        # let the import surface the error as before
+        return True
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if any(_attr_name(base) == 'BaseArbiter' for base in node.bases):
+            return True
+        for decorator in node.decorator_list:
+            func = decorator.func if isinstance(decorator, ast.Call) else decorator
+            if _attr_name(func) in ('arbiter_factory', 'register'):
+                return True
+    return False
+
 def discover_arbiter_modules(arbiter_dirs: List[Path]):
     for arbiter_dir in arbiter_dirs:
         if arbiter_dir.exists() and arbiter_dir.is_dir() and os.access(arbiter_dir, os.R_OK):
@@ -34,12 +68,29 @@ def discover_arbiter_modules(arbiter_dirs: List[Path]):
                 sys.path.append(str(arbiter_dir))
 
             # Discover all the arbiter modules in the directory
-            for file_path in arbiter_dir.iterdir():
-                if file_path.is_file() and file_path.suffix == '.py' and file_path.stem != '__init__':
+            # scandir entries cache the file type, saving a stat() per entry
+            with os.scandir(arbiter_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith('.py') or name == '__init__.py':
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    # skip modules already imported by a previous discovery pass
+                    resolved_path = os.path.realpath(entry.path)
+                    if resolved_path in _discovered:
+                        continue
+                    _discovered.add(resolved_path)
+
+                    # skip helper modules that declare no arbiter class
+                    if not _declares_arbiter(entry.path):
+                        continue
+
                     # construct the module name
-                    module_name = file_path.stem
+                    module_name = name[:-3]
                     # import the module
-                    spec = importlib.util.spec_from_file_location(module_name, file_path)
+                    spec = importlib.util.spec_from_file_location(module_name, entry.path)
                     if spec is not None:
                         module = importlib.util.module_from_spec(spec)
                         spec.loader.exec_module(module)
@@ -1,27 +1,46 @@
-from abc import ABC, abstractmethod
+from abc import ABC
 
 from wdmsim.arbiter.arbiter_factory import BaseArbiter
 from wdmsim.models.rx_slice import RxSlice
 from wdmsim.models.tuner import Tuner
 
+# Tuner states are plain ints; bind at module level to skip the class attribute lookup per instruction
+_LOCK_DONE = Tuner.LOCK_DONE
+
 
 class InstTemplate(ABC):
+    # instructions are built per lock-step, so skip the per-instance __dict__
+    __slots__ = ("arbiter", "_stage_iter", "done")
+
     _SUCCESS = 0
     _FAILURE = 1
 
     def __init__(self, arbiter: BaseArbiter):
         self.arbiter = arbiter
-        self._stage_iter = self.stage()
+
+        # stage iterator is only built on demand for multi-step instructions
+        self._stage_iter = None
 
         # stopper
         self.done = False
 
-    @abstractmethod
     def stage(self):
-        pass
+        """Multi-step instruction body as a generator (optional)
+        Single-step instructions override run() instead to skip the generator overhead
+        Subclasses must override one of the two
+        """
+        raise NotImplementedError(f"{type(self).__name__} must override stage() or run()")
 
     def run_step(self):
         if self.done is False:
+            # single-step instructions only override run(), which completes the instruction in one step
+            if type(self).stage is InstTemplate.stage:
+                if type(self).run is InstTemplate.run:
+                    self.stage()
+                self.run()
+                return
+            if self._stage_iter is None:
+                self._stage_iter = self.stage()
             next(self._stage_iter)
 
     def run(self):
@@ -30,38 +49,32 @@ class InstTemplate(ABC):
 
 
 class SearchInst(InstTemplate):
+    __slots__ = ("slice_idx", "tgt_slice")
+
     def __init__(self, arbiter: BaseArbiter, slice_idx: int):
         super().__init__(arbiter)
 
-        if slice_idx not in range(self.arbiter.num_slices):
+        if not 0 <= slice_idx < self.arbiter.num_slices:
             raise ValueError(f"Invalid target index, {slice_idx}")
 
         self.slice_idx = slice_idx
 
         self.tgt_slice: RxSlice = self.arbiter.rx_slices[slice_idx]
 
-    def stage(self):
-        self.tgt_slice.search_lock()
-        self.arbiter.memory["SEARCH_TABLES"].update(
-            {self.slice_idx: self.tgt_slice.tuner.search_table}
-        )
+    def run(self):
+        tgt_slice = self.tgt_slice
+        tgt_slice.search_lock()
+        self.arbiter._memory.set_entry("SEARCH_TABLES", self.slice_idx, tgt_slice.tuner.search_table)
         self.done = True
-        yield
-
-        # status_code = (
-        #     self._SUCCESS
-        #     if self.tgt_slice.tuner.search_status == Tuner.SEARCH_DONE
-        #     else self._FAILURE
-        # )
-        # self.done = True
-        # yield status_code
 
 
 class LockInst(InstTemplate):
+    __slots__ = ("slice_idx", "mode", "select", "tgt_slice")
+
     def __init__(self, arbiter: BaseArbiter, slice_idx: int, mode: str, select: int):
         super().__init__(arbiter)
 
-        if slice_idx not in range(self.arbiter.num_slices):
+        if not 0 <= slice_idx < self.arbiter.num_slices:
             raise ValueError(f"Invalid target index, {slice_idx}")
 
         self.slice_idx = slice_idx
@@ -70,92 +83,29 @@ class LockInst(InstTemplate):
 
         self.tgt_slice: RxSlice = self.arbiter.rx_slices[slice_idx]
 
-    def stage(self):
-        self.tgt_slice.search_and_acquire_lock(self.mode, self.select)
-        if self.tgt_slice.tuner.lock_status == Tuner.LOCK_DONE:
-            self.arbiter.memory["LOCK_TABLE"].update(
-                {self.slice_idx: self.tgt_slice.tuner.get_lock_idx()}
-            )
+    def run(self):
+        tgt_slice = self.tgt_slice
+        tuner = tgt_slice.tuner
+        tgt_slice.search_and_acquire_lock(self.mode, self.select)
+        if tuner.lock_status == _LOCK_DONE:
+            self.arbiter._memory.set_entry("LOCK_TABLE", self.slice_idx, tuner.get_lock_idx())
         self.done = True
-        yield
-
-        # status_code = (
-        #     self._SUCCESS
-        #     if self.tgt_slice.tuner.lock_status == Tuner.LOCK_DONE
-        #     else self._FAILURE
-        # )
-        # self.done = True
-        # yield status_code
 
 
 class UnlockInst(InstTemplate):
+    __slots__ = ("slice_idx", "tgt_slice")
+
     def __init__(self, arbiter: BaseArbiter, slice_idx: int):
         super().__init__(arbiter)
 
-        if slice_idx not in range(self.arbiter.num_slices):
+        if not 0 <= slice_idx < self.arbiter.num_slices:
             raise ValueError(f"Invalid target index, {slice_idx}")
 
         self.slice_idx = slice_idx
 
         self.tgt_slice: RxSlice = self.arbiter.rx_slices[slice_idx]
 
-    def stage(self):
+    def run(self):
         self.tgt_slice.release_lock()
-        self.arbiter.memory["LOCK_TABLE"].pop(self.slice_idx)
+        self.arbiter._memory.entry["LOCK_TABLE"].pop(self.slice_idx)
         self.done = True
-        yield
-
-        # yield self._SUCCESS
-
-
-# class LockThenSearchInst(InstTemplate):
-#     def __init__(
-#         self,
-#         arbiter: BaseArbiter,
-#         slice_idx: int,
-#         aggr_idx: int,
-#         aggr_lock_mode: str,
-#         aggr_peak_idx: int,
-#     ):
-#         super().__init__(arbiter)
-#
-#         if slice_idx not in self.arbiter.target_lane_order:
-#             raise ValueError(f"Invalid target index, {slice_idx}")
-#
-#         if aggr_idx not in self.arbiter.target_lane_order:
-#             raise ValueError(f"Invalid target index, {aggr_idx}")
-#
-#         self.slice_idx = slice_idx
-#         self.aggr_idx = aggr_idx
-#         self.aggr_lock_mode = aggr_lock_mode
-#         self.aggr_peak_idx = aggr_peak_idx
-#
-#         self.tgt_slice: RxSlice = self.arbiter.rx_slices[slice_idx]
-#         self.aggr_slice: RxSlice = self.arbiter.rx_slices[aggr_idx]
-#
-#     def stage(self):
-#         self.aggr_slice.search_and_acquire_lock(self.aggr_lock_mode, self.aggr_peak_idx)
-#         # status_code = (
-#         #     self._SUCCESS
-#         #     if self.aggr_slice.tuner.lock_status == Tuner.LOCK_DONE
-#         #     else self._FAILURE
-#         # )
-#         # yield status_code
-#         yield
-#
-#         self.tgt_slice.search_lock()
-#         self.arbiter.memory["SEARCH_TABLES"].update(
-#             {self.slice_idx: self.tgt_slice.tuner.search_table}
-#         )
-#         # status_code = (
-#         #     self._SUCCESS
-#         #     if self.tgt_slice.tuner.search_status == Tuner.SEARCH_DONE
-#         #     else self._FAILURE
-#         # )
-#         # yield status_code
-#         yield
-#
-#         self.aggr_slice.release_lock()
-#         self.done = True
-#         # yield self._SUCCESS
-#         yield
@@ -1,5 +1,5 @@
-from abc import ABC, abstractmethod
-from typing import Dict, List, Mapping, Optional, TypeVar, Union
+from abc import ABC
+from typing import ClassVar, Dict, List, Mapping, Optional, TypeVar, Union
 from copy import deepcopy
 import pprint
 from typing_extensions import TypedDict
@@ -8,22 +8,36 @@ from wdmsim.utils.update_dict import update_dict
 
 MEM_DATA_TYPE = Dict[int, Union[int, float]]
 
+# Values of these types are never mutated in place, so copies can share them
+_IMMUTABLE_TYPES = (int, float, str, bool, tuple, frozenset, type(None))
+
+
+def _copy_container(data):
+    """Copy a memory entry, falling back to deepcopy only when it holds mutable values"""
+    values = data.values() if isinstance(data, dict) else data
+    if all(isinstance(value, _IMMUTABLE_TYPES) for value in values):
+        return data.copy()
+    return deepcopy(data)
+
 
 class ArbiterMemoryTemplate(ABC):
     """
     Base class for arbiter memory
+    Subclasses declare SCHEMA as a plain class attribute mapping labels to entry types
     """
 
+    SCHEMA: ClassVar[Mapping[str, type]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.SCHEMA:
+            raise TypeError(f"{cls.__name__} must define a non-empty SCHEMA")
+
     def __init__(self):
         self.__entry = {}
         for label, value_type in self.SCHEMA.items():
             self.__entry[label] = value_type()
 
-    @property
-    @abstractmethod
-    def SCHEMA(self) -> Mapping[str, type]:
-        return NotImplementedError
-
     @property
     def entry(self) -> Dict[str, MEM_DATA_TYPE]:
         return self.__entry
@@ -37,7 +51,7 @@ class ArbiterMemoryTemplate(ABC):
         """
         Get all labels
         """
-        return [x for x in self.SCHEMA]
+        return list(self.SCHEMA)
 
     def __str__(self) -> str:
         return pprint.pformat(self.entry)
@@ -77,6 +91,17 @@ class ArbiterMemoryTemplate(ABC):
 
         update_dict(self.__entry, {label: data})
 
+    def set_entry(self, label: str, key: int, value: Union[int, float, set]) -> None:
+        """
+        Set a single item in memory without schema validation
+        Fast path for trusted internal callers (arbiter instructions); use update() otherwise
+
+        :param label: Label to update
+        :param key: Key within the label entry
+        :param value: Value to set
+        """
+        self.__entry[label][key] = value
+
     def fetch(self, label: str) -> MEM_DATA_TYPE:
         """
         Fetch data from memory
@@ -99,21 +124,22 @@ class ArbiterMemoryTemplate(ABC):
         data = self.entry[label]
         if index is None:
             # Copy all
-            return deepcopy(data)
+            return _copy_container(data)
         else:
             # Copy single item
             if isinstance(data, dict):
                 if index not in data:
                     raise KeyError(f"Index {index} not in {label}")
-                return deepcopy(data[index])
+                value = data[index]
             elif isinstance(data, list):
                 if index >= len(data):
                     raise IndexError(f"Index {index} out of range for {label}")
-                return deepcopy(data[index])
+                value = data[index]
             else:
                 raise NotImplementedError(f"Data {data} is not of type dict or list")
             # Copying multiple items from index list is not supported
             # since it would force the function to return a dictionary which is not consistent with the return type
+            return value if isinstance(value, _IMMUTABLE_TYPES) else deepcopy(value)
 
     def flush(self, label: str) -> None:
         """
@@ -1,10 +1,33 @@
 from abc import ABC, abstractmethod
 from typing import List, Union, Optional, Dict
 
+import numpy as np
+
 from wdmsim.models.rx_slice import RxSlice
 from wdmsim.models.tuner import Tuner
 from wdmsim.arbiter.arbiter_memory import BaseArbiterMemory
 
+# Tuner lock states checked by the arbiter helpers
+_ZERO_LOCK_STATES = frozenset({Tuner.LOCK_NO_WAVE, Tuner.LOCK_NOT_IN_RANGE})
+_DONE_STATES = frozenset({Tuner.LOCK_DONE})
+
+# Returned by next() on an exhausted algorithm stepper
+_TICK_SENTINEL = object()
+
+
+class ArbiterStepper:
+    """Explicit state machine form of an arbiter algorithm
+    An arbiter's algorithm() may return a stepper instead of a generator
+    so that each tick is a plain method call rather than a generator resume
+
+    step() advances the algorithm by one lock-step and returns False once the sequence is exhausted
+    """
+    def __init__(self, arbiter: "BaseArbiter"):
+        self.arbiter = arbiter
+
+    def step(self) -> bool:
+        raise NotImplementedError
+
 
 class BaseArbiter(ABC):
     _registry = {}
@@ -22,12 +45,35 @@ class BaseArbiter(ABC):
 
         self.num_slices = len(rx_slices)
 
-        self._step_algorithm = self.algorithm()
+        self._init_stepper()
         self._memory = BaseArbiterMemory()
 
         self.end_state = False
         self.lock_error_state = False
 
+    @classmethod
+    def register(cls, register_str_id: str):
+        """Class decorator to register an arbiter class under the string id used by the CLI
+
+        :param register_str_id: The string id of the arbiter
+        """
+        def _register(arb_cls):
+            BaseArbiter._registry[register_str_id] = arb_cls
+            return arb_cls
+        return _register
+
+    @property
+    def target_lane_order(self) -> Optional[List[int]]:
+        return self._target_lane_order
+
+    @target_lane_order.setter
+    def target_lane_order(self, target_lane_order: Optional[List[int]]) -> None:
+        self._target_lane_order = target_lane_order
+        # array copy for the lane order check of the system under test
+        self.target_lane_order_arr = (
+            np.asarray(target_lane_order, dtype=np.intp) if target_lane_order is not None else None
+        )
+
     @property
     def memory(self) -> BaseArbiterMemory:
         return self._memory
@@ -37,7 +83,7 @@ class BaseArbiter(ABC):
         self.lock_error_state = False
 
         # reset the algorithm stepper
-        self._step_algorithm = self.algorithm()
+        self._init_stepper()
 
         # reset the memory
         self.memory.reset()
@@ -48,24 +94,34 @@ class BaseArbiter(ABC):
 
         # TODO: performance implication?
         # reset the algorithm stepper
-        self._step_algorithm = self.algorithm()
+        self._init_stepper()
 
         # reset the memory
         self.memory.reset()
 
     @abstractmethod
     def algorithm(self):
+        """Arbiter algorithm, either a generator yielding at every lock-step or an ArbiterStepper"""
         raise NotImplementedError
 
+    def _init_stepper(self):
+        """(Re)build the algorithm stepper
+        """
+        self._step_algorithm = self.algorithm()
+        if isinstance(self._step_algorithm, ArbiterStepper):
+            self._step = self._step_algorithm.step
+        else:
+            self._step = None
+
     def tick(self):
-        try:
-            if not self.end_state and not self.lock_error_state:
-                next(self._step_algorithm)
-                return True
-            else:
-                return False
-        except StopIteration:
+        if self.end_state or self.lock_error_state:
+            return False
+        if self._step is not None:
+            if not self._step():
+                raise StopIteration("The arbiter has reached the end state")
+        elif next(self._step_algorithm, _TICK_SENTINEL) is _TICK_SENTINEL:
             raise StopIteration("The arbiter has reached the end state")
+        return True
 
     def is_end_state(self):
         return self.end_state
@@ -88,18 +144,12 @@ class BaseArbiter(ABC):
         if slice_idx is None:
             rx_slices = self.rx_slices
         elif isinstance(slice_idx, int):
-            rx_slices = [self.rx_slices[slice_idx]]
-        elif isinstance(slice_idx, list):
-            rx_slices = [self.rx_slices[i] for i in slice_idx]
+            return self.rx_slices[slice_idx].tuner.lock_status in _ZERO_LOCK_STATES
+        else:
+            rx_slices = (self.rx_slices[i] for i in slice_idx)
 
         # Check if there is a zero lock case
-        for rx_slice in rx_slices:
-            if rx_slice.tuner.lock_status in [
-                Tuner.LOCK_NO_WAVE,
-                Tuner.LOCK_NOT_IN_RANGE,
-            ]:
-                return True
-        return False
+        return any(rx_slice.tuner.lock_status in _ZERO_LOCK_STATES for rx_slice in rx_slices)
 
     def check_lock_done(
         self, slice_idx: Optional[Union[int, List[int]]] = None
@@ -116,12 +166,9 @@ class BaseArbiter(ABC):
         if slice_idx is None:
             rx_slices = self.rx_slices
         elif isinstance(slice_idx, int):
-            rx_slices = [self.rx_slices[slice_idx]]
-        elif isinstance(slice_idx, list):
-            rx_slices = [self.rx_slices[i] for i in slice_idx]
+            return self.rx_slices[slice_idx].tuner.lock_status in _DONE_STATES
+        else:
+            rx_slices = (self.rx_slices[i] for i in slice_idx)
 
-        # Check if there is a zero lock case
-        for rx_slice in rx_slices:
-            if rx_slice.tuner.lock_status in [Tuner.LOCK_DONE]:
-                return True
-        return False
+        # Check if there is a lock done case
+        return any(rx_slice.tuner.lock_status in _DONE_STATES for rx_slice in rx_slices)
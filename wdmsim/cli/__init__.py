@@ -0,0 +1,120 @@
+"""
+Fancy CLI interface to the simulator
+"""
+
+import importlib
+import click
+
+
+class _NaturalOrderGroup(click.Group):
+    """
+    Helper class to display subcommands in natural order 
+    ref: https://github.com/pallets/click/issues/513
+    """
+    def list_commands(self, ctx):
+        return self.commands.keys()
+
+
+class LazyGroup(_NaturalOrderGroup):
+    """
+    Group whose subcommands are imported only when dispatched to (or listed in help)
+    ref: https://click.palletsprojects.com/en/stable/complex/#lazily-loading-subcommands
+
+    :param lazy_subcommands: Map of command name to "module:command" import path
+    :param lazy_help: Map of command name to the short help shown in the group help
+    """
+    def __init__(self, *args, lazy_subcommands=None, lazy_help=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_help = lazy_help or {}
+
+    def list_commands(self, ctx):
+        return list(self.lazy_subcommands) + list(super().list_commands(ctx))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name):
+        module_name, cmd_object_name = self.lazy_subcommands[cmd_name].split(":")
+        cmd_object = getattr(importlib.import_module(module_name), cmd_object_name)
+        if not isinstance(cmd_object, click.Command):
+            raise ValueError(f"Lazy loading of {cmd_name} failed by returning a non-command object")
+        return cmd_object
+
+    def format_commands(self, ctx, formatter):
+        # List lazy subcommands from lazy_help so that `wdmsim --help` imports no command module
+        subcommands = list(self.list_commands(ctx))
+        if not subcommands:
+            return
+        limit = formatter.width - 6 - max(len(subcommand) for subcommand in subcommands)
+
+        rows = []
+        for subcommand in subcommands:
+            if subcommand in self.lazy_help:
+                rows.append((subcommand, self.lazy_help[subcommand]))
+                continue
+            cmd = self.get_command(ctx, subcommand)
+            if cmd is None or cmd.hidden:
+                continue
+            rows.append((subcommand, cmd.get_short_help_str(limit)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+# @click.command()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "run": "wdmsim.cli.commands.run:run",
+        "compare": "wdmsim.cli.commands.compare:compare",
+        "stat": "wdmsim.cli.commands.stat:stat",
+        "debug": "wdmsim.cli.commands.debug:debug",
+        "sweep": "wdmsim.cli.commands.sweep:sweep",
+        "sweep-compare": "wdmsim.cli.commands.sweep_compare:sweep_compare",
+        "plot": "wdmsim.cli.commands.plot:plot",
+        "plot-compare": "wdmsim.cli.commands.plot_compare:plot_compare",
+        "record": "wdmsim.cli.commands.record:record",
+        "replay": "wdmsim.cli.commands.replay:replay",
+        "list-arbiter": "wdmsim.cli.commands.list_arbiter:list_arbiter",
+    },
+    lazy_help={
+        "run": "Run a single experiment",
+        "compare": "Run a e2e comparison experiment",
+        "stat": "Run a statistics",
+        "debug": "Debug mode",
+        "sweep": "Run a sweep of experiments",
+        "sweep-compare": "Run a sweep of compare experiments",
+        "plot": "Plot from sweep",
+        "plot-compare": "Plot from sweep-compare",
+        "record": "Record a single experiment",
+        "replay": "Replay a single experiment",
+        "list-arbiter": "List available arbiters",
+    },
+)
+def cli():
+    """
+    CLI interface to the simulator
+    """
+    pass
+
+
+def main():
+    # multiprocessing start method is set by the sweep commands, the only ones using a process pool
+
+    # arbiter_path = os.environ.get("WDMSIM_ARBITER_PATH", "")
+    # if arbiter_path:
+    #     discover_arbiter_modules(Path(arbiter_path))
+    # else:
+    #     raise ValueError("Environment Variable WDMSIM_ARBITER_PATH is not set")
+    # Arbiter discovery is deferred until click dispatches to a command that needs the registry
+
+    return cli()
+    # try:
+    #     return cli()
+    # except Exception as e:
+    #     print(e)
+    #     traceback.print_exc()
+    #     import pdb; pdb.set_trace()
@@ -0,0 +1,39 @@
+"""
+`wdmsim compare` command
+"""
+
+import click
+
+from wdmsim.cli.common import ArbiterChoice, WdmSimCommand, dispatch_to_arbiters
+
+
+@click.command(cls=WdmSimCommand, help='Run a e2e comparison experiment')
+@click.option('-nl', '--num_laser_swaps', 
+              type=int, 
+              default=10, 
+              required=False,
+              show_default=True,
+              help='Number of laser swap iterations')
+@click.option('-nr', '--num_ring_swaps', 
+              type=int, 
+              default=1, 
+              required=False,
+              show_default=True,
+              help='Number of ring swap iterations')
+@click.option('-c', '--arbiter_compare', 
+              type=ArbiterChoice(),
+              metavar='NAME|INDEX',
+              required=True,
+              # multiple=True,
+              help='Arbiter of choice')
+@click.option('--stop_on_failure',
+              is_flag=True,
+              default=False,
+              required=False,
+              show_default=True,
+              help='Stop on failure (for interactive debugging)')
+def compare(**kwargs):
+    """
+    Run a single experiment
+    """
+    dispatch_to_arbiters("compare", **kwargs)
@@ -0,0 +1,27 @@
+"""
+`wdmsim debug` command
+"""
+
+import click
+
+from wdmsim.cli.common import WdmSimCommand, dispatch_to_arbiters
+
+
+@click.command(cls=WdmSimCommand, help='Debug mode')
+@click.option('--exit_status', 
+              type=int, 
+              default=0, 
+              required=False,
+              show_default=True,
+              help='target exit status for debug plot')
+@click.option('--plot',
+              is_flag=True,
+              required=False,
+              default=False,
+              show_default=True,
+              help='Plot snapshot of the system')
+def debug(**kwargs):
+    """
+    Run a single experiment
+    """
+    dispatch_to_arbiters("debug", **kwargs)
@@ -0,0 +1,21 @@
+"""
+`wdmsim list-arbiter` command
+"""
+
+import click
+
+from wdmsim.cli.common import _get_arbiter_map, _get_arbiter_paths
+
+
+@click.command(help="List available arbiters")
+def list_arbiter():
+    """
+    List available arbiters
+    """
+    print(f"Directories: (Set by $WDMSIM_ARBITER_PATH)")
+    for path in _get_arbiter_paths():
+        print(f"  {path.resolve()}")
+
+    print("Available arbiters: [index: arbiter]")
+    for index, arbiter in _get_arbiter_map().items():
+        print(f"{int(index):4}: {arbiter}")
@@ -0,0 +1,42 @@
+"""
+`wdmsim plot-compare` command
+"""
+
+import click
+
+from wdmsim.cli.common import ArbiterChoice, WdmSimCommand, dispatch_to_arbiters, plot_choice_type
+
+
+@click.command(cls=WdmSimCommand, help='Plot from sweep-compare')
+@click.option('-nl', '--num_laser_swaps',
+              type=int,
+              default=10,
+              required=False,
+              show_default=True,
+              help='Number of iterations')
+@click.option('-nr', '--num_ring_swaps',
+              type=int,
+              default=1,
+              required=False,
+              show_default=True,
+              help='Number of ring swap iterations')
+@click.option('-c', '--arbiter_compare', 
+              type=ArbiterChoice(),
+              metavar='NAME|INDEX',
+              required=True,
+              # multiple=True,
+              help='Arbiter of choice')
+@click.option('--plot_x_axis', 
+              type=plot_choice_type,
+              required=False,
+              help='x axis for plot (Currently only assuming ring sweep)')
+@click.option('--plot_y_axis', 
+              type=plot_choice_type,
+              required=False,
+              help='y axis for plot (Currently only assuming ring sweep)')
+def plot_compare(verbose, **kwargs):
+    """
+    Run a sweep of experiments
+    """
+    # plot_sweep_compare takes no verbose option
+    dispatch_to_arbiters("plot_sweep_compare", **kwargs)
@@ -0,0 +1,40 @@
+"""
+`wdmsim record` command
+"""
+
+from pathlib import Path
+
+import click
+
+from wdmsim.cli.common import WdmSimCommand, dispatch_to_arbiters
+
+
+@click.command(cls=WdmSimCommand, help='Record a single experiment')
+@click.option('--json_path', 
+              type=click.Path(exists=False, dir_okay=False, readable=True, resolve_path=True, path_type=Path),
+              required=True,
+              help='Specify the path to the JSON file')
+@click.option('-nl', '--num_laser_swaps', 
+              type=int, 
+              default=10, 
+              required=False,
+              show_default=True,
+              help='Number of laser swap iterations')
+@click.option('-nr', '--num_ring_swaps', 
+              type=int, 
+              default=1, 
+              required=False,
+              show_default=True,
+              help='Number of ring swap iterations')
+@click.option('--overwrite_json',
+              type=bool,
+              is_flag=True,
+              default=False,
+              required=False,
+              show_default=True,
+              help='Overwrite the JSON file if it exists')
+def record(**kwargs):
+    """
+    Run a single experiment
+    """
+    dispatch_to_arbiters("record", **kwargs)
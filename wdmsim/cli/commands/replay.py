@@ -0,0 +1,48 @@
+"""
+`wdmsim replay` command
+"""
+
+from pathlib import Path
+
+import click
+
+from wdmsim.cli.common import ArbiterChoice, WdmSimShortCommand, discover_from_arbiter_path
+
+
+@click.command(cls=WdmSimShortCommand, help='Replay a single experiment')
+@click.option('--json_path', 
+              type=click.Path(exists=True, dir_okay=False, readable=True, resolve_path=True, path_type=Path),
+              required=True,
+              help='Specify the path to the JSON file')
+@click.option('-a','--arbiter_override',
+              type=ArbiterChoice(),
+              metavar='NAME|INDEX',
+              required=False,
+              help='Override the arbiter to the specified from the JSON file record')
+@click.option('-v', '--verbose',
+              is_flag=True,
+              default=False,
+              show_default=True)
+def replay(
+    json_path, 
+    arbiter_override,
+    verbose,
+):
+    """
+    Run a single experiment
+    """
+
+    # # enable verbose
+    # enable_verbose(verbose)
+
+    # simulator stack is imported only once a command actually runs
+    import wdmsim.run as wdmsim_run
+    # import the arbiter modules; the option parser only needed their names
+    discover_from_arbiter_path()
+
+    # run the experiment
+    wdmsim_run.replay(
+        json_path=json_path,
+        arbiter_override=arbiter_override,
+        verbose=verbose,
+    )
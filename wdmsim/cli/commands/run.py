@@ -0,0 +1,42 @@
+"""
+`wdmsim run` command
+"""
+
+import click
+
+from wdmsim.cli.common import WdmSimCommand, dispatch_to_arbiters, use_fork_start_method
+
+
+@click.command(cls=WdmSimCommand, help='Run a single experiment')
+@click.option('--profile', 
+              is_flag=True, 
+              show_default=True,
+              required=False,
+              default=False,
+              help='Run in profile mode')
+@click.option('-nprocs', 
+              type=int, 
+              default=1, 
+              required=False,
+              show_default=True,
+              help='Number of processes to split the ring swaps over')
+@click.option('-nl', '--num_laser_swaps', 
+              type=int, 
+              default=10, 
+              required=False,
+              show_default=True,
+              help='Number of laser swap iterations')
+@click.option('-nr', '--num_ring_swaps', 
+              type=int, 
+              default=1, 
+              required=False,
+              show_default=True,
+              help='Number of ring swap iterations')
+def run(**kwargs):
+    """
+    Run a single experiment
+    """
+    # the ring swaps are only run over a process pool for nprocs != 1
+    if kwargs['nprocs'] != 1:
+        use_fork_start_method()
+    dispatch_to_arbiters("run", **kwargs)
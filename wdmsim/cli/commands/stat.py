@@ -0,0 +1,27 @@
+"""
+`wdmsim stat` command
+"""
+
+import click
+
+from wdmsim.cli.common import WdmSimCommand, dispatch_to_arbiters
+
+
+@click.command(cls=WdmSimCommand, help='Run a statistics')
+@click.option('--num_bins', 
+              type=int, 
+              default=10, 
+              required=False,
+              show_default=True,
+              help='Number of bins')
+@click.option('--plot',
+              is_flag=True,
+              default=False,
+              required=False,
+              show_default=True,
+              help='Plot the violin plot')
+def stat(**kwargs):
+    """
+    Run a statistics
+    """
+    dispatch_to_arbiters("stat", **kwargs)
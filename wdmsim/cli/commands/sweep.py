@@ -0,0 +1,35 @@
+"""
+`wdmsim sweep` command
+"""
+
+import click
+
+from wdmsim.cli.common import WdmSimCommand, dispatch_to_arbiters, use_fork_start_method
+
+
+@click.command(cls=WdmSimCommand, help='Run a sweep of experiments')
+@click.option('-nprocs', 
+              type=int, 
+              default=1, 
+              required=False,
+              show_default=True,
+              help='Number of processes to use for multiprocessing')
+@click.option('-nl', '--num_laser_swaps', 
+              type=int, 
+              default=10, 
+              required=False,
+              show_default=True,
+              help='Number of iterations')
+@click.option('-nr', '--num_ring_swaps',
+              type=int,
+              default=1,
+              required=False,
+              show_default=True,
+              help='Number of ring swap iterations')
+def sweep(**kwargs):
+    """
+    Run a sweep of experiments
+    """
+    # the sweep process pool is created even for nprocs == 1, so always fork
+    use_fork_start_method()
+    dispatch_to_arbiters("sweep", **kwargs)
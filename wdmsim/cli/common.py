@@ -0,0 +1,265 @@
+"""
+Shared options, command classes and arbiter discovery for the CLI commands
+"""
+
+import os
+import functools
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Tuple
+from pathlib import Path
+import click
+
+
+logger = logging.getLogger(__name__)
+
+# Arbiter names are cached here, keyed by the arbiter modules' paths and mtimes,
+# so help text and name validation don't have to import every arbiter plugin
+_ARBITER_CACHE_FILE = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "wdmsim" / "arbiters.json"
+
+@functools.lru_cache(maxsize=1)
+def _get_arbiter_paths() -> List[Path]:
+    # an unset path is only an error for the commands that need an arbiter,
+    # so that `wdmsim --help` and `wdmsim list-arbiter` still work without it
+    arbiter_path = os.environ.get("WDMSIM_ARBITER_PATH", "")
+    if not arbiter_path:
+        logger.warning("Environment Variable WDMSIM_ARBITER_PATH is not set")
+    return [Path(p) for p in arbiter_path.split(os.pathsep) if p]
+
+# Discover arbiters from the environment variable
+# Memoized and only triggered by the commands that instantiate an arbiter
+@functools.lru_cache(maxsize=1)
+def discover_from_arbiter_path() -> List[Path]:
+    # the arbiter package pulls in the device models, so import it only when discovering
+    from wdmsim.arbiter.arbiter_factory import discover_arbiter_modules
+
+    parsed_arbiter_path = _get_arbiter_paths()
+    if not parsed_arbiter_path:
+        raise click.UsageError("No arbiters to load: Environment Variable WDMSIM_ARBITER_PATH is not set")
+    discover_arbiter_modules(parsed_arbiter_path)
+    return parsed_arbiter_path
+
+def _arbiter_path_signature(arbiter_paths: List[Path]) -> str:
+    """Signature of the arbiter modules on the path, from a stat() of every .py file"""
+    stats = []
+    for arbiter_dir in arbiter_paths:
+        if not arbiter_dir.is_dir():
+            continue
+        with os.scandir(arbiter_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.py') and entry.is_file():
+                    stat = entry.stat()
+                    stats.append((entry.path, stat.st_mtime_ns, stat.st_size))
+    # builtin hash() of str is salted per process, so use a stable digest
+    return hashlib.sha1(repr(sorted(stats)).encode()).hexdigest()
+
+def _render_arbiter_help(names: List[str]) -> str:
+    """Arbiter list for the help footer"""
+    return "".join(
+        ["\n", "Arbiter Options:\n", "  [index]: [arbiter]\n"]
+        + [f"  {index:7}: {arbiter}\n" for index, arbiter in enumerate(names)]
+    )
+
+@functools.lru_cache(maxsize=1)
+def _load_arbiter_cache() -> Dict[str, Any]:
+    """Arbiter names and pre-rendered help footer, from the cache file when the arbiter modules are unchanged"""
+    arbiter_paths = _get_arbiter_paths()
+    if not arbiter_paths:
+        return {"names": [], "help": _render_arbiter_help([])}
+
+    signature = _arbiter_path_signature(arbiter_paths)
+    try:
+        with open(_ARBITER_CACHE_FILE) as f:
+            cache = json.load(f)
+        if cache["sig"] == signature and "names" in cache and "help" in cache:
+            return cache
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # cache miss: import the arbiter modules and refresh the cache
+    from wdmsim.arbiter.arbiter_factory import arbiter_registry
+
+    discover_from_arbiter_path()
+    names = list(arbiter_registry)
+    cache = {"sig": signature, "names": names, "help": _render_arbiter_help(names)}
+    try:
+        _ARBITER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_ARBITER_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        logger.debug(f"Could not write arbiter cache to {_ARBITER_CACHE_FILE}")
+    return cache
+
+def _get_arbiter_names() -> List[str]:
+    """Registered arbiter names"""
+    return _load_arbiter_cache()["names"]
+
+def dispatch_to_arbiters(runner_name: str, arbiter: List[str], **kwargs) -> None:
+    """Run wdmsim.run.<runner_name> once per selected arbiter
+
+    :param runner_name: Name of the wdmsim.run entry point
+    :param arbiter: Selected arbiters (multiple options enabled for arbiter choice)
+    :param kwargs: Remaining command options, forwarded as is
+    """
+    # simulator stack is imported only once a command actually runs
+    import wdmsim.run as wdmsim_run
+    # import the arbiter modules; the option parser only needed their names
+    discover_from_arbiter_path()
+
+    runner = getattr(wdmsim_run, runner_name)
+    for arbiter_sel in arbiter:
+        runner(arbiter=arbiter_sel, **kwargs)
+
+def use_fork_start_method() -> None:
+    """Set the multiprocessing start method to 'fork' for the sweep process pools"""
+    import multiprocessing
+    if hasattr(multiprocessing, 'set_start_method'):
+        # This patch is for Unix-based systems only
+        # From Python 3.8, the default start method is 'spawn' which renders CLI-based sweeps (`wdmsim sweep`)
+        # to be erroneous, as the child processes do not inherit the parent's environment variables
+        # and thus cannot find the arbiter modules
+        # This patch sets the start method to 'fork' which is the default method for Python 3.7 and below
+        # For Windows, this doesn't work; Please use the `python -m wdmsim` command instead.
+        multiprocessing.set_start_method('fork', force=True)  # Only available on Unix-based systems
+
+def is_plot_option_set(ctx: click.Context, param: click.Parameter, value: str) -> Any:
+    if ctx.params.get('plot') and not value:
+        raise click.BadParameter('The option should be set if plot is enabled')
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _get_arbiter_map() -> Dict[str, str]:
+    """Map of [index] -> [arbiter], built on first use from the (cached) arbiter names"""
+    return {str(i): arbiter for i, arbiter in enumerate(_get_arbiter_names())}
+
+def _format_arbiter_help(formatter: click.HelpFormatter):
+    formatter.write(_load_arbiter_cache()["help"])
+
+class ArbiterChoice(click.Choice):
+    """
+    Choice over the registered arbiter names, also accepting an arbiter [index]
+    The choices are resolved on first use, so declaring the option doesn't trigger arbiter discovery
+    """
+    name = "arbiter"
+
+    def __init__(self):
+        super().__init__(())
+
+    @property
+    def choices(self):
+        return tuple(_get_arbiter_names())
+
+    @choices.setter
+    def choices(self, value):
+        # fixed by the arbiter registry
+        pass
+
+    def convert(self, value, param, ctx):
+        if not self.choices:
+            raise click.UsageError("No arbiters available: set WDMSIM_ARBITER_PATH to the arbiter directories", ctx)
+        # map a numeric index to the corresponding arbiter, then validate as a plain choice
+        return super().convert(_get_arbiter_map().get(value, value), param, ctx)
+
+
+# Config file/section option pairs shared by every simulator command:
+# (short flag prefix, option name prefix, default file, default section, help label)
+_CONFIG_SPECS = [
+    ('l', 'laser_config', 'configs/example_laser_config.yml', 'msa-8', 'Laser config'),
+    ('r', 'ring_config', 'configs/example_ring_config.yml', 'msa-8', 'Ring config'),
+    ('ilo', 'init_lane_order_config', 'configs/example_lane_order.yml', 'linear_8', 'Initial lane order config'),
+    ('tlo', 'tgt_lane_order_config', 'configs/example_lane_order.yml', 'linear_8', 'Target lane order config'),
+]
+
+_PATH_TYPE = click.Path(exists=True, file_okay=True, dir_okay=False)
+
+def _config_options() -> List[click.Option]:
+    options = []
+    for short, name, default_file, default_section, label in _CONFIG_SPECS:
+        options.append(click.Option(
+            [f'-{short}f', f'--{name}_file'],
+            type=_PATH_TYPE,
+            default=default_file,
+            show_default=True,
+            help=f'{label} file'
+        ))
+        options.append(click.Option(
+            [f'-{short}s', f'--{name}_section'],
+            type=str,
+            default=default_section,
+            show_default=True,
+            help=f'{label} section'
+        ))
+    return options
+
+# Options shared by every simulator command, built once and reused by each WdmSimCommand
+_SHARED_OPTIONS = [
+    click.Option(
+        ['-a', '--arbiter'], 
+        type=ArbiterChoice(),
+        metavar='NAME|INDEX',
+        required=True, 
+        multiple=True, 
+        help='Arbiter of choice'
+    ),
+    *_config_options(),
+    click.Option(
+        ['--results_dir'],
+        # type=click.Path(exists=True, file_okay=False, dir_okay=True),
+        # Let the simulator to create the directory if it doesn't exist
+        type=click.Path(exists=False, file_okay=False, dir_okay=True, path_type=Path),
+        default='results',
+        show_default=True,
+        help='Results directory'
+    ),
+    click.Option(
+        ['-v', '--verbose'], 
+        is_flag=True, 
+        default=False, 
+        required=False, 
+        show_default=True, 
+        help='Enable verbose output'
+    ),
+]
+
+
+class WdmSimCommand(click.Command):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Add the shared options to the command
+        self.params.extend(_SHARED_OPTIONS)
+
+    def format_help(self, ctx, formatter):
+        super().format_help(ctx, formatter)
+        # Add additional help text
+        _format_arbiter_help(formatter)
+        # formatter.write("\n")
+        # formatter.write("Arbiter Options:\n")
+        # formatter.write(f"  [index]: [arbiter]\n")
+        # # formatter.write("-" * 50 + "\n")
+        # for index, arbiter in _arbiter_map.items():
+        #     formatter.write(f"  {int(index):7}: {arbiter}\n")
+
+
+class WdmSimShortCommand(click.Command):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def format_help(self, ctx, formatter):
+        super().format_help(ctx, formatter)
+        # Add additional help text
+        _format_arbiter_help(formatter)
+
+
+plot_choice : Tuple[str, ...] = (
+    'fsr_mean',
+    'fsr_variance',
+    'tuning_range_mean',
+    'tuning_range_variance',
+    'resonance_variance',
+    "grid_variance",
+)
+
+# one Choice instance shared by the plot axis options
+plot_choice_type = click.Choice(plot_choice)
@@ -0,0 +1,48 @@
+
+"""
+Numeric kernels of the ring row wave propagation
+They work on plain float64/bool arrays so that the row can run the per-tick cascade without OpticalWave objects
+They are numpy only, with no JIT/compile step at import or first call, so short runs pay no warm-up cost;
+a compiled drop-in has to keep the same signatures and write into the given output buffers
+"""
+
+import numpy as np
+
+
+def row_cascade(
+    input_wl: np.ndarray, curr_wl: np.ndarray, tol: float, out_masks: np.ndarray, diff_buf: np.ndarray = None,
+) -> np.ndarray:
+    """Laser grabbing cascade of a ring row
+    out_masks[i, j] is True if the wavelength input_wl[j] passes rings 0..i of the row,
+    i.e. it is not within tol of the current wavelength of any of these rings
+
+    :param input_wl: wavelengths at the row input, shape (W,)
+    :param curr_wl: current wavelengths of the rings in row order, shape (N,)
+    :param tol: matching tolerance (0 matches by exact equality)
+    :param out_masks: boolean output buffer, shape (N, W)
+    :param diff_buf: optional float64 scratch buffer, shape (N, W), allocated if not given
+    :return: out_masks
+    """
+    # keep[i, j]: wavelength j is not dropped by ring i
+    # (branchless |input - curr| > tol, computed in place)
+    diff = np.subtract(input_wl[None, :], curr_wl[:, None], out=diff_buf)
+    np.abs(diff, out=diff)
+    np.greater(diff, tol, out=out_masks)
+
+    # keep[i, j]: wavelength j passes rings 0..i
+    # (logical_and.accumulate stays in bool, unlike cumprod which goes through an integer product)
+    np.logical_and.accumulate(out_masks, axis=0, out=out_masks)
+    return out_masks
+
+
+def drop_index(in_wl: np.ndarray, wave_idx: int, out_wl: np.ndarray) -> np.ndarray:
+    """Copy of a wavelength array without the wavelength at wave_idx
+
+    :param in_wl: wavelengths, shape (W,)
+    :param wave_idx: index of the wavelength to drop, 0 <= wave_idx < W
+    :param out_wl: output buffer, shape (W-1,)
+    :return: out_wl
+    """
+    out_wl[:wave_idx] = in_wl[:wave_idx]
+    out_wl[wave_idx:] = in_wl[wave_idx + 1:]
+    return out_wl
@@ -1,6 +1,8 @@
 
 from typing import List, Union
 
+import numpy as np
+
 from wdmsim.models.optical_wave import OpticalWave
 from wdmsim.models.optical_port import OpticalPort, OpticalPortType
 from wdmsim.models.sim_instance import SimInstance
@@ -16,9 +18,14 @@ class Laser:
     especially when lock procedures are done in multiple time steps and 
     filtered laser grids at previous time steps are not visible at current time step
 
+    Once added to a LaserGrid, a laser is a thin view on the grid's wavelength array:
+    reading or writing its wavelength goes to the grid's storage at the laser's index
+
     Attributes:
         wavelength: wavelength of the laser in nm
     """
+    __slots__ = ('_wavelength', '_grid', '_idx')
+
     def __init__(self, wavelength: float):
         """Inits Laser with wavelength and lock status
         
@@ -29,7 +36,29 @@ class Laser:
 
         :param wavelength: wavelength of the laser in nm
         """
-        self.wavelength = wavelength
+        self._wavelength = wavelength
+        self._grid = None
+        self._idx = 0
+
+    @property
+    def wavelength(self) -> float:
+        if self._grid is None:
+            return self._wavelength
+        return self._grid._wl_array[self._idx].item()
+
+    @wavelength.setter
+    def wavelength(self, wavelength: float) -> None:
+        if self._grid is None:
+            self._wavelength = wavelength
+        else:
+            self._grid._wl_array[self._idx] = wavelength
+            self._grid._refresh_out_wave()
+
+    def _bind(self, grid: 'LaserGrid', idx: int) -> None:
+        """Attach the laser to a slot of the grid's wavelength array
+        """
+        self._grid = grid
+        self._idx = idx
 
 
 class LaserGrid(SimInstance):
@@ -37,8 +66,12 @@ class LaserGrid(SimInstance):
 
     It initializes waves at the output port of the laser grid at startup
 
+    Wavelengths are kept as a single float64 array (structure of arrays) so that
+    a wavelength shuffle is one array copy rather than a loop over the lasers
+
     Attributes:
-        lasers: list of lasers in the grid
+        lasers: tuple of lasers in the grid, fixed at construction
+        wavelengths: list of wavelengths of the lasers
     """
     def __init__(self, lasers: Union[Laser, List[Laser]]) -> None:
         """
@@ -48,10 +81,23 @@ class LaserGrid(SimInstance):
         if isinstance(lasers, Laser):
             lasers = [lasers]
 
-        self.lasers = lasers
-
         # Collect wavelengths of lasers in the grid
-        self.wavelengths = [laser.wavelength for laser in lasers]
+        wl_array = np.fromiter((laser.wavelength for laser in lasers), dtype=np.float64, count=len(lasers))
+        self._init_grid(wl_array, lasers)
+
+    def _init_grid(self, wl_array: np.ndarray, lasers: List[Laser]) -> None:
+        """Shared initializer of __init__ and from_ndarray
+
+        :param wl_array: float64 array of wavelengths, owned by the grid from now on
+        :param lasers: lasers to bind to the array, one per wavelength
+        """
+        # Bind the lasers to the wavelength array
+        self._wl_array = wl_array
+        self.lasers = tuple(lasers)
+        self._bind_lasers()
+
+        # Output wave of the grid, rebuilt whenever the wavelengths change
+        self._out_wave = OpticalWave.from_ndarray(self._wl_array)
 
         # Initialize ports
         self._init_ports()
@@ -81,7 +127,19 @@ class LaserGrid(SimInstance):
         if isinstance(wavelengths, float):
             wavelengths = [wavelengths]
 
-        return cls([Laser(wavelength) for wavelength in wavelengths])
+        return cls.from_ndarray(np.array(wavelengths, dtype=np.float64))
+
+    @classmethod
+    def from_ndarray(cls, wl_array: np.ndarray) -> 'LaserGrid':
+        """Fast path constructor without input type checks
+        The grid keeps the array as its wavelength storage (no copy)
+
+        :param wl_array: 1-D float64 array of wavelengths in nm
+        :return: LaserGrid instance
+        """
+        grid = cls.__new__(cls)
+        grid._init_grid(wl_array, [Laser(0.0) for _ in range(wl_array.shape[0])])
+        return grid
 
     @property
     def num_channels(self) -> int:
@@ -89,7 +147,15 @@ class LaserGrid(SimInstance):
 
         :return: number of channels in the grid
         """
-        return len(self.lasers)
+        return self._wl_array.shape[0]
+
+    @property
+    def wavelengths(self) -> List[float]:
+        """Returns wavelengths of lasers in the grid
+
+        :return: list of wavelengths in nm
+        """
+        return self._wl_array.tolist()
 
     @property
     def laser_id(self) -> int:
@@ -107,6 +173,12 @@ class LaserGrid(SimInstance):
         """
         return self._ports
 
+    def _bind_lasers(self) -> None:
+        """Point every laser at its slot of the wavelength array
+        """
+        for laser_idx, laser in enumerate(self.lasers):
+            laser._bind(self, laser_idx)
+
     def _init_ports(self):
         """Initialize ports of the laser
         """
@@ -137,10 +209,10 @@ class LaserGrid(SimInstance):
         """
         if isinstance(wavelengths, float):
             wavelengths = [wavelengths]
-        self.wavelengths = wavelengths
-    
-        for laser_idx, laser in enumerate(self.lasers):
-            laser.wavelength = wavelengths[laser_idx]
+
+        # lasers read through to the array, so this updates all of them at once
+        np.copyto(self._wl_array, np.asarray(wavelengths, dtype=np.float64))
+        self._refresh_out_wave()
 
         # self.initialize_wave()
 
@@ -148,7 +220,19 @@ class LaserGrid(SimInstance):
         """Initialize output wave of the laser grid
         Turn on all lasers in the grid
         """
-        self.ports['out'].wave = OpticalWave(self.wavelengths)
+        self.ports['out'].wave = self._out_wave
+
+    def _refresh_out_wave(self) -> None:
+        """Rebuild the output wave from the wavelength array
+        A new wave is built rather than rewriting the old one, since waves handed out downstream are immutable
+        and a ring row only recomputes when its input wave object changes (see RingRxWDMRow.propagate_wave)
+        If the grid is plugged in, the port moves to the new wave
+        """
+        out_port = self.ports['out']
+        plugged = out_port.wave is self._out_wave
+        self._out_wave = OpticalWave.from_ndarray(self._wl_array)
+        if plugged:
+            out_port.wave = self._out_wave
 
     """
     Override built-in functions to achieve:
@@ -165,16 +249,15 @@ class LaserGrid(SimInstance):
 
     def __setitem__(self, index: int, laser: Laser) -> None:
         """
-        :param index: index of laser in the grid
-        :param laser: laser to set at index
+        The lasers of a grid are fixed at construction; change wavelengths with shuffle_wavelengths
         """
-        self.lasers[index] = laser
+        raise TypeError("LaserGrid does not support laser assignment, use shuffle_wavelengths")
 
     def __delitem__(self, index: int) -> None:
         """
-        :param index: index of laser to delete
+        The lasers of a grid are fixed at construction
         """
-        del self.lasers[index]
+        raise TypeError("LaserGrid does not support laser deletion")
 
     def __len__(self) -> int:
         return len(self.lasers)
@@ -3,9 +3,14 @@
 from typing import List, Optional, Union
 from enum import Enum, auto
 
-from wdmsim.models.optical_wave import OpticalWave
+from wdmsim.models.optical_wave import OpticalWave, EMPTY_WAVE
 from wdmsim.models.sim_instance import SimInstance
 
+def _pull_nothing() -> None:
+    """pull_wave of a port without connection
+    """
+
+
 class OpticalPortType(Enum):
     """Enum for optical port types."""
     IN = auto()
@@ -18,15 +23,21 @@ class OpticalPort:
     and carry the optical signals.
     Currently assuming point-to-point and unidirectional connection.
     """
+    __slots__ = ('name', 'device', 'is_output', 'is_input', 'port_conn', 'is_connected', 'wave', 'pull_wave')
+
     def __init__(self, device: SimInstance, name: str, port_type: OpticalPortType) -> 'OpticalPort':
         self.name : str = name
         self.device = device
-        self.port_type = port_type
+        # port direction kept as plain flags; port_type is derived from them
+        self.is_output : bool = port_type is OpticalPortType.OUT
+        self.is_input : bool = not self.is_output
 
         self.port_conn : Optional[OpticalPort] = None
         self.is_connected : bool = False
+        # grabs the wave of the connected port, resolved at connection time (no-op until connected)
+        self.pull_wave = _pull_nothing
 
-        self.wave : OpticalWave = OpticalWave()
+        self.wave : OpticalWave = EMPTY_WAVE
 
     def __str__(self):
         return f"OpticalPort({self.device}:{self.name})"
@@ -34,6 +45,13 @@ class OpticalPort:
     def __repr__(self):
         return f"OpticalPort({self.device}:{self.name})"
 
+    @property
+    def port_type(self) -> OpticalPortType:
+        """
+        Return the port type
+        """
+        return OpticalPortType.OUT if self.is_output else OpticalPortType.IN
+
     @property
     def wavelengths(self) -> List[float]:
         """
@@ -46,12 +64,19 @@ class OpticalPort:
         Connection setter
         It establishes unidirectional connectivity.
         """
-        assert from_port.port_type == OpticalPortType.OUT, "Only OUT port can be connected"
-        assert self.port_type == OpticalPortType.IN, "Only IN port can be connected"
+        assert from_port.is_output, "Only OUT port can be connected"
+        assert self.is_input, "Only IN port can be connected"
 
         self.port_conn = from_port
         self.is_connected = True
-    
+        self.pull_wave = self._pull_from_conn
+
+    def _pull_from_conn(self) -> None:
+        """
+        pull_wave of a connected port
+        """
+        self.wave = self.port_conn.wave
+
     def propagate_wave_from_conn(self) -> None:
         """
         Propagate the wave to the connected port
@@ -1,22 +1,89 @@
 
 from typing import List, Optional, Set, Union
 
+import numpy as np
+
+from wdmsim.models.sysclk import _FAST_MODE
 from wdmsim.utils.pretty_print import format_wavelengths
 
+
+def _check_sorted_unique(arr: np.ndarray) -> None:
+    """Sanity check of the wave storage rule: strictly increasing, i.e. sorted and duplicate-free
+    The filtering kernels and the wave indices handed to the tuners rely on it
+    Skipped in release mode (see sysclk._FAST_MODE)
+    """
+    if _FAST_MODE:
+        return
+    assert arr.shape[0] < 2 or bool((arr[1:] > arr[:-1]).all()), \
+        "OpticalWave wavelengths must be sorted and duplicate-free"
+
+
+"""
+Filtering kernels over a sorted, duplicate-free float64 array (the OpticalWave storage rule)
+Both locate their endpoints by binary search (searchsorted) and return slices,
+so a filter costs O(log n) plus the copy of the result at most
+A repeated wavelength would be kept twice by _filter_range and shift the wave indices,
+so every array reaching them goes through np.unique or a set routine first
+"""
+def _filter_range(arr: np.ndarray, wavelength_min: float, wavelength_max: float) -> np.ndarray:
+    """Wavelengths within [wavelength_min, wavelength_max] of a sorted array (a view)
+    """
+    lo = np.searchsorted(arr, wavelength_min, side='left')
+    hi = np.searchsorted(arr, wavelength_max, side='right')
+    return arr[lo:hi]
+
+
+def _filter_out_range(arr: np.ndarray, wavelength_min: float, wavelength_max: float) -> Optional[np.ndarray]:
+    """Wavelengths outside of [wavelength_min, wavelength_max] of a sorted array
+    None if no wavelength falls within the range (nothing to filter out)
+    """
+    lo = np.searchsorted(arr, wavelength_min, side='left')
+    hi = np.searchsorted(arr, wavelength_max, side='right')
+    if lo == hi:
+        return None
+    return np.concatenate((arr[:lo], arr[hi:]))
+
+
+def filter_matrix(wl_arr: np.ndarray, centers: np.ndarray, bws: np.ndarray) -> np.ndarray:
+    """Passband matrix of a bank of filters over a wavelength array
+    Entry (m, n) is True if wavelength m falls within the passband of filter n,
+    i.e. within bws[n]/2 of centers[n] (inclusive, as filter_by_wavelength_range)
+    Lets a caller filter every channel in one broadcast comparison instead of one filter call per channel:
+    wl_arr[mask.any(axis=1)] are the wavelengths seen by any filter, wl_arr[mask[:, n]] those seen by filter n
+
+    :param wl_arr: wavelengths, shape (M,)
+    :param centers: filter center wavelengths, shape (N,)
+    :param bws: filter bandwidths, shape (N,) or scalar
+    :return: boolean matrix of shape (M, N)
+    """
+    wl_arr = np.asarray(wl_arr, dtype=np.float64)
+    centers = np.asarray(centers, dtype=np.float64)
+    half_bws = np.asarray(bws, dtype=np.float64) / 2
+    return np.abs(wl_arr[:, None] - centers[None, :]) <= half_bws
+
+
+# Waves longer than this are summarized by repr (count and end wavelengths)
+_REPR_MAX_WAVES = 32
+
+
 class OpticalWave:
     """Optical Waves class
     It models continuous wave optical signal as a set of wavelengths
     It defines a convenient algebra for signal propagation and filtering by set operations
+    Wavelengths are stored as a sorted float64 array so that the set operations run in numpy
+    Waves are treated as immutable once built (see _rebind for the exception);
+    membership tests match wavelengths by exact float equality
 
     >> OpticalWaves({1310, 1311, 1312})
     >> OpticalWaves({1310, 1311})[0]
-    >> OpticalWaves({1310, 1311})[0] = 1310.5
     >> len(OpticalWaves({1310, 1311}))
     >> for wavelength in OpticalWaves({1310, 1311}): print(wavelength)
 
     :param wavelengths: set of wavelengths by list
     :type wavelengths: List[float]
     """
+    __slots__ = ('_wl', '_wl_set')
+
     def __init__(self, wavelengths: Optional[Union[float, Set[float], List[float]]] = None):
         """Optical Waves class
         It models continuous wave optical signal as a set of wavelengths
@@ -35,8 +102,45 @@ class OpticalWave:
         elif isinstance(wavelengths, set):
             wavelengths = list(wavelengths)
             
-        # Initialize the set of wavelengths as sorted
-        self.wavelengths = sorted(wavelengths)
+        # Initialize the set of wavelengths as sorted and deduplicated in one pass
+        self._wl = np.unique(np.asarray(wavelengths, dtype=np.float64))
+        # membership set, built on the first membership test
+        self._wl_set = None
+
+    @classmethod
+    def _from_sorted_unique(cls, arr: np.ndarray) -> "OpticalWave":
+        """Build from an already sorted, duplicate-free float64 array without sorting again
+        Internal use only: every operator routes its result through here since
+        numpy set routines (union1d, setdiff1d, ...) and slices of a sorted array are already sorted and unique
+        The public __init__ path (which sorts) is kept for user-supplied input
+        """
+        _check_sorted_unique(arr)
+        obj = cls.__new__(cls)
+        obj._wl = arr
+        obj._wl_set = None
+        return obj
+
+    @classmethod
+    def from_ndarray(cls, arr: np.ndarray) -> "OpticalWave":
+        """Fast path constructor without input type checks
+        Sorts and deduplicates like __init__ but skips its branching on the input type
+
+        :param arr: 1-D float64 array of wavelengths, in any order
+        """
+        return cls._from_sorted_unique(np.unique(arr))
+
+    def _rebind(self, arr: np.ndarray) -> None:
+        """Point the wave at another sorted, duplicate-free float64 array (typically a view on a preallocated buffer)
+        Internal use only: the exception to wave immutability are the ring thru waves, owned by the ring and
+        refreshed at every row propagation (see RingRxWDM._refill_thru_wave)
+        """
+        self._wl = arr
+        self._wl_set = None
+
+    @property
+    def wavelengths(self) -> List[float]:
+        """Sorted list of wavelengths"""
+        return self._wl.tolist()
 
     def __add__(self, other) -> "OpticalWave":
         """Addition operator
@@ -44,7 +148,7 @@ class OpticalWave:
 
         """
         if isinstance(other, OpticalWave):
-            return OpticalWave(set(self.wavelengths).union(set(other.wavelengths)))
+            return OpticalWave._from_sorted_unique(np.union1d(self._wl, other._wl))
         else:
             raise TypeError("Unsupported operand type(s) for +: 'OpticalWaves' and '{}'".format(type(other)))
 
@@ -56,12 +160,20 @@ class OpticalWave:
         >> OpticalWaves({1310, 1312})
         """
         if isinstance(other, OpticalWave):
-            return OpticalWave(set(self.wavelengths) - set(other.wavelengths))
+            # a ring dropping its wavelength subtracts a single-wavelength wave
+            if other._wl.shape[0] == 1:
+                return self.drop_wavelength(other._wl[0])
+            # no assume_unique: setdiff1d then dedupes itself, so a wavelength carried twice is still dropped
+            return OpticalWave._from_sorted_unique(np.setdiff1d(self._wl, other._wl))
         else:
             raise TypeError("Unsupported operand type(s) for -: 'OpticalWaves' and '{}'".format(type(other)))
 
     def __repr__(self):
         # return f"OpticalWaves({self.wavelengths})"
+        # repr ends up in error messages and debug logs, so long waves are only summarized;
+        # use str() for the full list
+        if self._wl.shape[0] > _REPR_MAX_WAVES:
+            return f"OpticalWaves(n={self._wl.shape[0]}, {format_wavelengths([self[0], self[-1]])})"
         return f"OpticalWaves({format_wavelengths(self.wavelengths)})"
 
     def __str__(self):
@@ -76,28 +188,28 @@ class OpticalWave:
     - membership (w in self)
     - equality (self == other)
     """
+    # element access hands out python floats (tolist) rather than numpy scalars
     def __getitem__(self, index: int) -> float:
-        return self.wavelengths[index]
-
-    def __setitem__(self, index: int, value: float):
-        self.wavelengths[index] = value
+        return self._wl[index].tolist()
 
     def __len__(self):
-        return len(self.wavelengths)
+        return self._wl.shape[0]
 
     def __iter__(self):
-        return iter(self.wavelengths)
+        return iter(self._wl.tolist())
 
     def __next__(self):
-        return next(self.wavelengths)
+        return next(self._wl)
 
     def __contains__(self, item):
-        return item in self.wavelengths
+        if self._wl_set is None:
+            self._wl_set = frozenset(self._wl.tolist())
+        return item in self._wl_set
 
     def __eq__(self, other):
         if other is None:
-            return len(self.wavelengths) == 0
-        return self.wavelengths == other.wavelengths
+            return self._wl.shape[0] == 0
+        return np.array_equal(self._wl, other._wl)
 
     def filter_by_wavelength(self, wavelength: float, invert: bool) -> "OpticalWave":
         """Filter by wavelength
@@ -110,13 +222,44 @@ class OpticalWave:
         >> OpticalWaves({1310, 1312})
         """
         if invert:
-            return OpticalWave(set(self.wavelengths) - set([wavelength]))
-        else:
-            if wavelength in self.wavelengths:
-                return OpticalWave(wavelength)
-            else:
-                return OpticalWave([])
-                # return None
+            return self.drop_wavelength(wavelength)
+        return self.keep_wavelength(wavelength)
+
+    def drop_wavelength(self, wavelength: float, tol: float = 0.0) -> "OpticalWave":
+        """Drop the wavelengths within tol of the given wavelength
+        It models a ring dropping its resonant wavelength, by binary search instead of a mask over the waves
+        The wave itself is returned if nothing is dropped (waves are immutable)
+
+        >> OpticalWaves({1310, 1311, 1312}).drop_wavelength(1311)
+        >> OpticalWaves({1310, 1312})
+
+        :param wavelength: wavelength to drop
+        :param tol: matching tolerance (0 matches by exact equality)
+        """
+        thru_wl = _filter_out_range(self._wl, wavelength - tol, wavelength + tol)
+        if thru_wl is None:
+            return self
+        return OpticalWave._from_sorted_unique(thru_wl)
+
+    def keep_wavelength(self, wavelength: float, tol: float = 0.0) -> "OpticalWave":
+        """Keep only the wavelengths within tol of the given wavelength
+        It models the drop port of a ring
+
+        >> OpticalWaves({1310, 1311, 1312}).keep_wavelength(1311)
+        >> OpticalWaves({1311})
+
+        :param wavelength: wavelength to keep
+        :param tol: matching tolerance (0 matches by exact equality)
+        """
+        return OpticalWave._from_sorted_unique(_filter_range(self._wl, wavelength - tol, wavelength + tol))
+
+    def remove_wavelength(self, wavelength: float) -> "OpticalWave":
+        """Remove a single wavelength (exact match), see drop_wavelength
+
+        >> OpticalWaves({1310, 1311, 1312}).remove_wavelength(1311)
+        >> OpticalWaves({1310, 1312})
+        """
+        return self.drop_wavelength(wavelength)
 
     def filter_by_wavelength_range(self, wavelength_min: float, wavelength_max: float) -> "OpticalWave":
         """Filter by wavelength range
@@ -125,7 +268,7 @@ class OpticalWave:
         >> OpticalWaves({1310, 1311, 1312}).filter_by_wavelength_range(1311, 1312)
         >> OpticalWaves({1311, 1312})
         """
-        return OpticalWave({wavelength for wavelength in self.wavelengths if wavelength_min <= wavelength <= wavelength_max})
+        return OpticalWave._from_sorted_unique(_filter_range(self._wl, wavelength_min, wavelength_max))
 
     def filter_by_wave_idx(self, wave_idx: int, invert: bool) -> "OpticalWave":
         """Filter by wave index
@@ -138,12 +281,20 @@ class OpticalWave:
         >> OpticalWaves({1310, 1311, 1312}).filter_by_wave_idx(1, invert=True)
         >> OpticalWaves({1310, 1312})
         """
-        # TODO: better way to do this?
         if invert:
-            return OpticalWave(set(self.wavelengths) - set([self.wavelengths[wave_idx]]))
+            return OpticalWave._from_sorted_unique(np.delete(self._wl, wave_idx))
         else:
-            return OpticalWave(self.wavelengths[wave_idx])
+            return OpticalWave._from_sorted_unique(self._wl[[wave_idx]])
     
+    def filter_matrix(self, centers: np.ndarray, bws: np.ndarray) -> np.ndarray:
+        """Passband matrix of a bank of filters over the wavelengths (see module-level filter_matrix)
+        Row m corresponds to the m-th wavelength of the wave (self[m])
+
+        >> OpticalWaves({1310, 1311, 1312}).filter_matrix([1311], [1])
+        >> [[True], [True], [True]]
+        """
+        return filter_matrix(self._wl, centers, bws)
+
     def get_wavelength(self, wave_idx: int) -> float:
         """Get wavelength by wave index
         It models wavelength retrieval with the wave index as a reference when the wavelength is not known
@@ -152,7 +303,7 @@ class OpticalWave:
         >> OpticalWaves({1310, 1311, 1312}).get_wavelength(1)
         >> 1311
         """
-        return self.wavelengths[wave_idx]
+        return self[wave_idx]
 
     #  def pop(self, index: int = -1) -> float:
     #      """Pop a wavelength from the set of wavelengths
@@ -169,6 +320,12 @@ class OpticalWave:
     
 
 
+# Shared empty wave, used as the default wave of every optical port
+# Waves are never modified in place, and the read-only buffer guards against it
+EMPTY_WAVE = OpticalWave()
+EMPTY_WAVE._wl.flags.writeable = False
+
+
 if __name__ == "__main__":
     optical_waves = OpticalWave({1310, 1311, 1312})
     for w in optical_waves:
@@ -1,11 +1,20 @@
 
 from typing import List, Dict
 
+import numpy as np
+
+from wdmsim.models._ring_kernels import row_cascade, drop_index
 from wdmsim.models.laser_grid import LaserGrid
 from wdmsim.models.optical_wave import OpticalWave
 from wdmsim.models.optical_port import OpticalPort, OpticalPortType
 from wdmsim.models.sim_instance import SimInstance
 
+# Wavelength match tolerance of the row propagation, relative to the ring spacing
+_WAVELENGTH_TOL_REL = 1e-9
+
+# Indices of the ring (and ring row) ports in port_list
+PORT_IN, PORT_THRU = 0, 1
+
 # TODO: disabled drop port for now - roll back or fix if needed
 class Ring:
     """Ring class
@@ -18,6 +27,8 @@ class Ring:
         fsr: free spectral range of the ring
         tuning_range: the length of the tuning sweep range of the ring with full-scale voltage DAC
     """
+    __slots__ = ('wavelength', 'fsr', 'tuning_range')
+
     def __init__(self, wavelength: float, fsr: float, tuning_range: float) -> None:
         """
         :param wavelength: wavelength of the ring at voltage mid-code
@@ -71,6 +82,9 @@ class RingRxWDM(Ring, SimInstance):
 
         curr_wavelength: current wavelength of the ring (used only for visualization/debugging purposes)
     """
+    __slots__ = ('_port_in', '_port_thru', '_ports', 'port_list', '_sysclk', '_curr_wavelength', '_row', '_row_idx',
+                 '_dirty_bit', '_thru_wave', '_thru_buf', '_sweep_range_key', '_sweep_range_cache')
+
     def __init__(self, wavelength: float, fsr: float, tuning_range: float) -> None:
         """
         :param wavelength: wavelength of the ring at voltage mid-code
@@ -89,13 +103,25 @@ class RingRxWDM(Ring, SimInstance):
         self._sysclk = 0
 
         # this variable is used only for visualization/debugging purposes
-        self.curr_wavelength : float = wavelength
-
-    def __str__(self) -> str:
-        return f"Ring(wavelength={self.wavelength}, fsr={self.fsr}, sweep_length={self.tuning_range})"
-
-    def __repr__(self) -> str:
-        return f"Ring(wavelength={self.wavelength}, fsr={self.fsr}, sweep_length={self.tuning_range})"
+        # once the ring is in a row, it lives in the row's current wavelength array (see RingRxWDMRow)
+        self._row = None
+        self._row_idx = 0
+        self._curr_wavelength : float = wavelength
+
+        # thru wave owned by the ring and refilled in place at every row propagation,
+        # backed by a buffer sized for the largest input wave seen so far
+        self._thru_buf = np.empty(0, dtype=np.float64)
+        self._thru_wave = OpticalWave._from_sorted_unique(self._thru_buf)
+
+        # bit of the ring in the row's dirty bitmap, set when the ring changes its waves or its current wavelength
+        # outside of the row propagation, so that the row only recomputes from the first changed ring
+        # (see RingRxWDMRow.propagate_wave)
+        self._dirty_bit = 0
+
+        # tuner sweep range of the ring and the (wavelength, tuning_range, fsr) it was computed for
+        # (see Tuner.get_sweep_range)
+        self._sweep_range_key = None
+        self._sweep_range_cache = None
 
     @property
     def ports(self) -> OpticalPort:
@@ -105,22 +131,54 @@ class RingRxWDM(Ring, SimInstance):
         """
         return self._ports
 
+    @property
+    def curr_wavelength(self) -> float:
+        """Current wavelength of the ring set by the tuner
+        """
+        if self._row is None:
+            return self._curr_wavelength
+        return self._row._curr_wavelength_arr[self._row_idx].item()
+
+    @curr_wavelength.setter
+    def curr_wavelength(self, wavelength: float) -> None:
+        if self._row is None:
+            self._curr_wavelength = wavelength
+        else:
+            self._row._curr_wavelength_arr[self._row_idx] = wavelength
+
+    def _bind(self, row: 'RingRxWDMRow', row_idx: int) -> None:
+        """Attach the ring to a slot of the row's arrays
+        """
+        self._row = row
+        self._row_idx = row_idx
+        self._dirty_bit = 1 << row_idx
+
+    def _mark_dirty(self) -> None:
+        """Flag the ring as changed in the row's dirty bitmap (no-op outside of a row)
+        """
+        row = self._row
+        if row is not None:
+            row._dirty_bits |= self._dirty_bit
+
     def _init_ports(self):
         """Initialize ports of the laser
         """
-        self._ports = {}
-        self._ports['in'] : OpticalPort = OpticalPort(self, 'in', OpticalPortType.IN)
-        self._ports['thru'] : OpticalPort = OpticalPort(self, 'thru', OpticalPortType.OUT)
-        # self._ports['drop'] : OpticalPort = OpticalPort(self, 'drop', OpticalPortType.OUT)
+        # ports are plain attributes for the per-tick paths; the ports dict is kept for external consumers
+        self._port_in : OpticalPort = OpticalPort(self, 'in', OpticalPortType.IN)
+        self._port_thru : OpticalPort = OpticalPort(self, 'thru', OpticalPortType.OUT)
+        # self._port_drop : OpticalPort = OpticalPort(self, 'drop', OpticalPortType.OUT)
+        self._ports = {'in': self._port_in, 'thru': self._port_thru}
+        # ports indexed by PORT_IN/PORT_THRU, for lookups without hashing the port names
+        self.port_list = (self._port_in, self._port_thru)
 
     def passthrough_wave(self) -> None:
         """
         This function initializes the waves in the ring as pass-through
         """
-        if self.ports['in'].is_connected:
-            self.ports['in'].propagate_wave_from_conn()
-        self.ports['thru'].wave : OpticalPort = self.ports['in'].wave
+        self._port_in.pull_wave()
+        self._port_thru.wave : OpticalPort = self._port_in.wave
         # self.ports['drop'].wave : OpticalPort = OpticalWave()
+        self._mark_dirty()
 
     def propagate_wave(self) -> None:
         """
@@ -138,12 +196,27 @@ class RingRxWDM(Ring, SimInstance):
         # Duplicate lock will be accounted for at the SUT level
         #
         # TODO: this is very tricky, but good to keep this way (for now, sv would behave differently)
-        if self.ports['in'].is_connected:
-            self.ports['in'].propagate_wave_from_conn()
+        self._port_in.pull_wave()
 
         # IN -> THRU is propagated at every time step
-        self.ports['thru'].wave = self.ports['in'].wave.filter_by_wavelength(self.curr_wavelength, invert=True)
-        # self.ports['drop'].wave = self.ports['in'].wave.filter_by_wavelength(self.curr_wavelength, invert=False)
+        self._port_thru.wave = self._port_in.wave.drop_wavelength(self.curr_wavelength)
+        # self.ports['drop'].wave = self._port_in.wave.keep_wavelength(self.curr_wavelength)
+
+    def _refill_thru_wave(self, in_wl: np.ndarray, keep: np.ndarray, num_keep: int) -> OpticalWave:
+        """
+        Refill the ring-owned thru wave with the kept wavelengths of the row input, without allocating a new wave
+        Used by the row propagation (RingRxWDMRow.propagate_wave)
+        :param in_wl: sorted wavelengths at the row input
+        :param keep: boolean mask of the wavelengths passing the ring
+        :param num_keep: number of True entries in keep
+        :return: the ring's thru wave
+        """
+        if self._thru_buf.shape[0] < in_wl.shape[0]:
+            self._thru_buf = np.empty(in_wl.shape[0], dtype=np.float64)
+        thru_wl = self._thru_buf[:num_keep]
+        in_wl.compress(keep, out=thru_wl)
+        self._thru_wave._rebind(thru_wl)
+        return self._thru_wave
 
     def acquire_lock(self, wavelength: float) -> None:
         """
@@ -151,8 +224,8 @@ class RingRxWDM(Ring, SimInstance):
         Not sure if working well due to floating point comparison errors (reltol~1e-16?)
         """
         # Update the waves in the ring
-        self.ports['thru'].wave = self.ports['in'].wave.filter_by_wavelength(wavelength, invert=True)
-        # self.ports['drop'].wave = self.ports['in'].wave.filter_by_wavelength(wavelength, invert=False)
+        self._port_thru.wave = self._port_in.wave.drop_wavelength(wavelength)
+        # self.ports['drop'].wave = self._port_in.wave.keep_wavelength(wavelength)
 
         # Update the current wavelength for visualization
         self.set_curr_wavelength(wavelength)
@@ -165,11 +238,17 @@ class RingRxWDM(Ring, SimInstance):
         :param wave_idx: wavelength index
         """
         # Update the waves in the ring
-        self.ports['thru'].wave = self.ports['in'].wave.filter_by_wave_idx(wave_idx, invert=True)
-        # self.ports['drop'].wave = self.ports['in'].wave.filter_by_wave_idx(wave_idx, invert=False)
+        # (filter_by_wave_idx(wave_idx, invert=True) done directly on the wavelength array)
+        # the lock wave gets its own array rather than the ring's thru buffer:
+        # the downstream ring may still hold the previous thru wave until the next propagation
+        in_wl = self._port_in.wave._wl
+        lock_wavelength = in_wl[wave_idx].item()
+        thru_wl = drop_index(in_wl, wave_idx, np.empty(in_wl.shape[0] - 1, dtype=np.float64))
+        self._port_thru.wave = OpticalWave._from_sorted_unique(thru_wl)
+        # self.ports['drop'].wave = self._port_in.wave.filter_by_wave_idx(wave_idx, invert=False)
 
         # Update the current wavelength for visualization
-        self.set_curr_wavelength(self.ports['in'].wave.wavelengths[wave_idx])
+        self.set_curr_wavelength(lock_wavelength)
     
     def release_lock(self) -> None:
         """
@@ -197,6 +276,7 @@ class RingRxWDM(Ring, SimInstance):
         :type wavelength: float
         """
         self.curr_wavelength = wavelength
+        self._mark_dirty()
     
     def reset_curr_wavelength(self) -> None:
         """
@@ -204,10 +284,13 @@ class RingRxWDM(Ring, SimInstance):
         This function is only used for visualization purposes
         """
         self.curr_wavelength = self.wavelength
+        self._mark_dirty()
     
 
 class RingRxWDMRow(SimInstance):
     """Ring Row class for Rx WDM
+    The ring parameters are also kept as arrays over the row (structure of arrays),
+    and the rings read and write their current wavelength through the row array
 
     Attributes:
         rings: list of rings
@@ -223,10 +306,29 @@ class RingRxWDMRow(SimInstance):
         self.rings = rings
 
         # Connect the rings
+        self._wave_path = []
+        # keep mask buffer of propagate_wave_vectorized, reused across time steps
+        self._keep_buf = np.empty((0, 0), dtype=bool)
+        self._diff_buf = np.empty((0, 0), dtype=np.float64)
+        # row input wave at the last propagation, to detect upstream (laser grid) changes
+        self._last_in_wave = None
         self.connect_rings()
 
-        # helper list of wavelengths
-        self.wavelengths = [ring.wavelength for ring in self.rings]
+        # ring parameters as arrays over the row; the rings are bound to the current wavelength array
+        num_rings = len(self.rings)
+        self._wavelength_arr = np.fromiter((ring.wavelength for ring in self.rings), dtype=np.float64, count=num_rings)
+        self._fsr_arr = np.fromiter((ring.fsr for ring in self.rings), dtype=np.float64, count=num_rings)
+        self._tuning_range_arr = np.fromiter((ring.tuning_range for ring in self.rings), dtype=np.float64, count=num_rings)
+        self._curr_wavelength_arr = np.fromiter((ring.curr_wavelength for ring in self.rings), dtype=np.float64, count=num_rings)
+        # bit i is set when ring i changed since the last propagation
+        self._dirty_bits = 0
+        for ring_idx, ring in enumerate(self.rings):
+            ring._bind(self, ring_idx)
+        # ring_row_params, built on first access (the ring parameters are fixed after construction)
+        self._ring_row_params = None
+
+        # tolerance of the wavelength match in the row propagation
+        self._wavelength_tol = self._calc_wavelength_tol()
 
         # Initialize ports
         self._init_ports()
@@ -252,20 +354,51 @@ class RingRxWDMRow(SimInstance):
         return self._ports
 
     @property
-    def ring_row_params(self) -> Dict[str, float]:
-        return [{'fsr': ring.fsr, 'tuning_range': ring.tuning_range} for ring in self.rings]
+    def wavelengths(self) -> List[float]:
+        """Returns list of wavelengths of the rings
+        """
+        return self._wavelength_arr.tolist()
+
+    @property
+    def ring_row_params(self) -> List[Dict[str, float]]:
+        """Returns list of ring parameters (fsr, tuning_range) of the rings
+        The list is cached and shared between calls, do not modify it
+        """
+        if self._ring_row_params is None:
+            self._ring_row_params = [
+                {'fsr': fsr, 'tuning_range': tuning_range}
+                for fsr, tuning_range in zip(self._fsr_arr.tolist(), self._tuning_range_arr.tolist())
+            ]
+        return self._ring_row_params
 
     def _init_ports(self):
         """Initialize ports of the laser
         """
-        self._ports = {}
-        self._ports['in'] = self.rings[0].ports['in']
-        self._ports['thru'] = self.rings[-1].ports['thru']
+        self._port_in = self.rings[0]._port_in
+        self._port_thru = self.rings[-1]._port_thru
+        self._ports = {'in': self._port_in, 'thru': self._port_thru}
+        self.port_list = (self._port_in, self._port_thru)
+        # in/thru ports of all the rings in row order
+        self._in_ports = tuple(ring._port_in for ring in self.rings)
+        self._thru_ports = tuple(ring._port_thru for ring in self.rings)
 
         # self._ports['drop'] = {}
         # for idx, ring in enumerate(self.rings):
         #     self._ports['drop'][idx] = ring.ports['drop']
 
+    def _calc_wavelength_tol(self) -> float:
+        """
+        Tolerance of the wavelength match between a ring and the incoming waves in the row propagation
+        A ring's current wavelength is always taken from the waves (lock) or its own resonance (unlocked),
+        so the match only has to absorb floating point noise, not model a passband:
+        it is set far below the ring spacing (a ring resting next to a laser must not drop it)
+        """
+        if self._wavelength_arr.shape[0] > 1:
+            ring_spacing = np.min(np.diff(np.sort(self._wavelength_arr)))
+        else:
+            ring_spacing = self.rings[0].fsr
+        return _WAVELENGTH_TOL_REL * float(ring_spacing)
+
     def connect_rings(self) -> None:
         """
         This function defines the geometric connection between the rings in the row
@@ -288,7 +421,9 @@ class RingRxWDMRow(SimInstance):
         """
         for i in range(1, len(self.rings)):
             # important to make a correct unidirectional connection!
-            self.rings[i].ports['in'].conn(from_port=self.rings[i-1].ports['thru'])
+            self.rings[i]._port_in.conn(from_port=self.rings[i-1]._port_thru)
+
+        self._build_wave_path()
 
     def connect_laser_grid(self, laser_grid: LaserGrid) -> None:
         """
@@ -303,9 +438,26 @@ class RingRxWDMRow(SimInstance):
         :param laser_grid: LaserGrid object
         """
         # important to make a correct unidirectional connection!
-        self.rings[0].ports['in'].conn(from_port=laser_grid.ports['out'])
+        self._port_in.conn(from_port=laser_grid.ports['out'])
         self._is_laser_connected = True
 
+        self._build_wave_path()
+
+    def _build_wave_path(self) -> None:
+        """
+        Flatten the row connectivity into a list of (source port, in port, thru port, ring) in ring order
+        The source port is None for an unconnected input
+        Rebuilt whenever a connection changes, so that wave propagation walks a flat list
+        instead of dispatching through every ring and port at each time step
+        """
+        self._wave_path = [
+            (ring._port_in.port_conn if ring._port_in.is_connected else None,
+             ring._port_in, ring._port_thru, ring)
+            for ring in self.rings
+        ]
+        # connectivity changed, recompute the whole row at the next propagation
+        self._last_in_wave = None
+
     def passthrough_wave(self) -> None:
         """
         Run at initialization
@@ -316,20 +468,71 @@ class RingRxWDMRow(SimInstance):
             # raise ValueError("Laser grid is not connected to the row")
 
         # Initialize the waves in the row
-        for ring in self.rings:
-            ring.passthrough_wave()
+        # every ring passes its input through, so all the in/thru ports carry the row input wave
+        self._port_in.pull_wave()
+        row_in_wave = self._port_in.wave
+        for in_port, thru_port in zip(self._in_ports, self._thru_ports):
+            in_port.wave = thru_port.wave = row_in_wave
 
-    def propagate_wave(self) -> None:
+        # waves were reset, recompute the whole row at the next propagation
+        self._last_in_wave = None
+
+    def propagate_wave_vectorized(self) -> None:
         """
         This function models the time evolution of the row by propagating the waves through the rings
         At each time step, thru port waves are modulated externally by tuner lock acquisition and release
         The updated thru port waves are then propagated downstream to the next rings which is modeled by the function
-        The waves are propagated by grabbing the waves from the thru port of the previous ring to the input port of the ring
-        If the previous instance is a laser grid, the waves are grabbed from the laser grid to the input port of the ring
-        """
-        # Starting from the second ring in the row, propagate the waves from the previous ring to the input port of the ring
-        # Skip the first ring in the row because the waves are already propagated to the input port of the first ring
-        # at the wave initialization of the row
-        # for ring in self.rings[1:]:
-        for ring in self.rings:
-            ring.propagate_wave()
+
+        Row-level form of RingRxWDM.propagate_wave: one numpy pass over the row instead of one filter per ring
+        Since the rings are chained thru -> in, the thru wave of ring i is the row input without
+        the current wavelengths of rings 0..i (laser grabbing priority)
+        This is computed as a (rings x wavelengths) keep mask, accumulated down the rings with a logical and,
+        and row i of the mask selects the thru wave of ring i
+
+        The propagation is event-driven: rings upstream of the first changed ring (lock acquired or released)
+        keep their waves, and nothing is recomputed if neither the row input nor any ring has changed
+        """
+        # find the first ring whose waves may have changed since the last time step
+        src_port, in_port, _, _ = self._wave_path[0]
+        row_in_wave = src_port.wave if src_port is not None else in_port.wave
+        if row_in_wave is not self._last_in_wave:
+            start = 0
+        else:
+            dirty_bits = self._dirty_bits
+            if not dirty_bits:
+                return
+            # lowest set bit: everything downstream of the first changed ring is recomputed anyway
+            start = (dirty_bits & -dirty_bits).bit_length() - 1
+        self._last_in_wave = row_in_wave
+        wave_path = self._wave_path[start:]
+
+        # pull the input of the first changed ring from its source (laser grid or upstream ring)
+        in_port = wave_path[0][1]
+        in_port.pull_wave()
+        in_wl = in_port.wave._wl
+
+        num_rings = len(wave_path)
+        curr_wl = self._curr_wavelength_arr[start:]
+        # the buffers only grow: a restart from a dirty ring pulls a narrower input (upstream locks dropped
+        # wavelengths), which is served by a view on the top-left corner of the buffers
+        num_waves = in_wl.shape[0]
+        if self._keep_buf.shape[0] < num_rings or self._keep_buf.shape[1] < num_waves:
+            buf_shape = (max(len(self.rings), self._keep_buf.shape[0]), max(num_waves, self._keep_buf.shape[1]))
+            self._keep_buf = np.empty(buf_shape, dtype=bool)
+            self._diff_buf = np.empty(buf_shape, dtype=np.float64)
+        # keep[i, j]: wavelength j passes rings 0..i
+        keep = row_cascade(in_wl, curr_wl, self._wavelength_tol,
+                           self._keep_buf[:num_rings, :num_waves], self._diff_buf[:num_rings, :num_waves])
+
+        # size of the thru wave of every ring, counted in one pass over the mask
+        num_keeps = np.count_nonzero(keep, axis=1).tolist()
+
+        thru_wave = None
+        for ring_idx, (_, in_port, thru_port, ring) in enumerate(wave_path):
+            if ring_idx > 0:
+                in_port.wave = thru_wave
+            thru_wave = thru_port.wave = ring._refill_thru_wave(in_wl, keep[ring_idx], num_keeps[ring_idx])
+        self._dirty_bits = 0
+
+    # propagate_wave runs once per time step, so it is the vectorized propagation itself rather than a wrapper
+    propagate_wave = propagate_wave_vectorized
@@ -22,6 +22,8 @@ class RxSlice:
         ring: ring object
         tuner: tuner object
     """
+    __slots__ = ('ring', 'tuner')
+
     def __init__(self, ring: RingRxWDM, tuner: Tuner) -> None:
         """
         At initialization, instantiate ring and tuner and reset the system
@@ -9,6 +9,8 @@ class SimInstance(ABC):
     It keeps the base properties as port, sysclk
     
     """
+    # no instance dict of its own, so that subclasses can use __slots__
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -1,46 +1,66 @@
 """
-Singleton class to manage the system clock.
+System clock, kept as module-level state
 """
 
-class SysClk:
-    __instance__ = None
+_clk = 0
+
+
+def get_clk() -> int:
+    return _clk
+
+
+def tick() -> None:
+    global _clk
+    _clk += 1
 
-    def __init__(self):
-        if SysClk.__instance__ is None:
-            SysClk.__instance__ = self
-        else:
-            raise Exception("This class is a singleton!")
 
-        SysClk.__instance__ = self
-        self.__clk = 0
+def reset() -> None:
+    global _clk
+    _clk = 0
 
+
+class SysClk:
+    """
+    Thin wrapper over the module-level system clock, kept for backwards compatibility
+    All instances share the same clock
+    """
     @staticmethod
-    def get_instance():
-        if SysClk.__instance__ is None:
-            SysClk()
-        return SysClk.__instance__
+    def get_instance() -> "SysClk":
+        return _SYSCLK
 
-    def get_clk(self):
-        return self.__clk
+    def get_clk(self) -> int:
+        return _clk
 
-    def tick(self):
-        self.__clk += 1
+    def tick(self) -> None:
+        tick()
 
-    def reset(self):
-        self.__clk = 0
+    def reset(self) -> None:
+        reset()
+
+
+_SYSCLK = SysClk()
     
     
 """
 Useful utils
 """
 
+import os
+
 from wdmsim.models.sim_instance import SimInstance
 
+# Release mode (python -O or WDMSIM_FAST set): the decorators below drop their checks at decoration time
+_FAST_MODE = not __debug__ or bool(os.environ.get('WDMSIM_FAST'))
+
 
 def execute_at_init(func):
     """
     Decorator to verify that the function is called at initialization
+    In release mode the check is skipped and the function is returned as is
     """
+    if _FAST_MODE:
+        return func
+
     def wrapper(self, *args, **kwargs):
         try:
             if self.sysclk == 0:
@@ -57,7 +77,14 @@ def execute_at_init(func):
 def reset_sysclk(func):
     """
     Decorator to reset sysclk to zero
+    In release mode the reset is done without the instance checks
     """
+    if _FAST_MODE:
+        def fast_wrapper(self, *args, **kwargs):
+            self.sysclk = 0
+            return func(self, *args, **kwargs)
+        return fast_wrapper
+
     def wrapper(self, *args, **kwargs):
         try:
             self.sysclk = 0
@@ -2,7 +2,6 @@
 import logging
 from typing import List, Optional, Type, Dict, Union
 
-from copy import deepcopy, copy
 import numpy as np
 from art import text2art
 
@@ -26,6 +25,9 @@ from wdmsim.utils.logger import _VERBOSE
 
 logger = logging.getLogger(__name__)
 
+# Lock wavelengths closer than this (relative) are taken as a duplicate lock
+_DUPLICATE_LOCK_TOL_REL = 1e-12
+
 
 class SystemUnderTest(SimInstance):
     """System Under Test class
@@ -42,6 +44,9 @@ class SystemUnderTest(SimInstance):
         arbiter: Arbiter object
         ring_wdm_row: WDM ring row from Rx slices
     """
+    __slots__ = ('rx_slices', 'arbiter', 'snapshots', 'lock_code_distr', 'relation_distr',
+                 '_sysclk', '_verbose', '_ring_wdm_row', '_lock_wavelengths')
+
     # Class variables for SUT experiment exit conditions
     EXIT_SUCCESS = 0
     EXIT_ZERO_LOCK = 1
@@ -57,6 +62,11 @@ class SystemUnderTest(SimInstance):
         self.rx_slices = rx_slices
         self.arbiter = arbiter
 
+        # Lock wavelengths of the tuners as one array (NaN when unlocked), written by the tuners
+        self._lock_wavelengths = np.full(len(rx_slices), np.nan)
+        for slice_idx, rx_slice in enumerate(rx_slices):
+            rx_slice.tuner._bind(self._lock_wavelengths, slice_idx)
+
         # Initialize system snapshot for visualization
         self.snapshots = []
 
@@ -68,6 +78,9 @@ class SystemUnderTest(SimInstance):
         # Initialize system clock
         self._sysclk = 0
 
+        # WDM ring row over the rings of the Rx slices, built at the hard reset
+        self._ring_wdm_row = None
+
         # System hard reset at boot up
         self.hard_reset()
 
@@ -82,11 +95,19 @@ class SystemUnderTest(SimInstance):
     @property
     def ring_wdm_row(self) -> RingRxWDMRow:
         """Get ring WDM row"""
-        return RingRxWDMRow(rings=[rx_slice.ring for rx_slice in self.rx_slices])
+        return self._ring_wdm_row
 
     @property
     def ports(self) -> OpticalPort:
-        return self.ring_wdm_row.ports
+        return self._ring_wdm_row.ports
+
+    def _update_ring_wdm_row(self) -> None:
+        """(Re)build the ring WDM row if the rings of the Rx slices are not the ones of the current row
+        """
+        rings = [rx_slice.ring for rx_slice in self.rx_slices]
+        row = self._ring_wdm_row
+        if row is None or len(row.rings) != len(rings) or any(a is not b for a, b in zip(row.rings, rings)):
+            self._ring_wdm_row = RingRxWDMRow(rings=rings)
 
     # # TODO: remove this?
     # @classmethod
@@ -169,6 +190,12 @@ class SystemUnderTest(SimInstance):
             rx_slice.hard_reset()
         self.arbiter.hard_reset()
 
+        # Build the ring row (only rebuilt if the Rx slices were replaced)
+        self._update_ring_wdm_row()
+
+        # Cache the verbose logging flag, checked at every tick (logging is configured before a run)
+        self._verbose = logger.isEnabledFor(_VERBOSE)
+
         # Reset system snapshot
         self.snapshots = []
 
@@ -184,6 +211,9 @@ class SystemUnderTest(SimInstance):
             rx_slice.soft_reset()
         self.arbiter.soft_reset()
 
+        # Cache the verbose logging flag, checked at every tick (logging is configured before a run)
+        self._verbose = logger.isEnabledFor(_VERBOSE)
+
         # Reset system snapshot
         self.snapshots = []
 
@@ -202,13 +232,13 @@ class SystemUnderTest(SimInstance):
         # logger.info(f"\nlaser grid {laser_grid.laser_id}: {format_wavelengths(laser_grid.ports['out'].wave.wavelengths)}")
 
         # Plug in laser
-        self.ring_wdm_row.connect_laser_grid(laser_grid)
+        self._ring_wdm_row.connect_laser_grid(laser_grid)
 
         # Turn on laser
         laser_grid.initialize_wave()
 
         # Rings downstream from the first ring will be initialized by the wavefront
-        self.ring_wdm_row.passthrough_wave()
+        self._ring_wdm_row.passthrough_wave()
     
         # # check by printing the wavefronts at the ring inputs
         # logger.info(f"first ring input: {self.ring_wdm_row.rings[0].ports['in'].wave.wavelengths}")
@@ -229,14 +259,13 @@ class SystemUnderTest(SimInstance):
         self.arbiter.tick()
 
         # Update optical signals by propagating wavefronts through the rings downstream
-        self.ring_wdm_row.propagate_wave()
+        self._ring_wdm_row.propagate_wave()
 
         # log the current tuner state and the arbiter state
-        if logger.isEnabledFor(_VERBOSE):
+        if self._verbose:
             logger.debug(f"tuner lock status: {[rx_slice.tuner.lock_status for rx_slice in self.rx_slices]}")
             logger.debug(f"tuner lock data: {[rx_slice.tuner.lock_data for rx_slice in self.rx_slices]}")
-            tuner_wvl = [rx_slice.tuner.lock_wavelength for rx_slice in self.rx_slices]
-            logger.debug(f"tuner wvl: {format_wavelengths(tuner_wvl)}")
+            logger.debug(f"tuner wvl: {format_wavelengths(self._lock_wavelengths)}")
             logger.debug(f"arbiter state: {self.arbiter.state}")
 
         # Update system clock
@@ -264,7 +293,7 @@ class SystemUnderTest(SimInstance):
 
         # If plot snapshot is enabled, plot the initial snapshot, otherwise skip
         if plot_snapshot:
-            self.snapshots += [Snapshot(self.sysclk, self.ring_wdm_row, self.arbiter, laser_grid)]
+            self.snapshots.append(Snapshot(self.sysclk, self._ring_wdm_row, self.arbiter, laser_grid))
         else:
             self.snapshots = []
 
@@ -272,23 +301,28 @@ class SystemUnderTest(SimInstance):
         # while not self.arbiter.is_end_state():
         #     self.tick()
         #     if plot_snapshot:
-        #         self.snapshots += [Snapshot(self.sysclk, self.ring_wdm_row, self.arbiter, laser_grid)]
+        #         self.snapshots += [Snapshot(self.sysclk, self._ring_wdm_row, self.arbiter, laser_grid)]
 
-        if logger.isEnabledFor(_VERBOSE):
+        if self._verbose:
             lock_status = LockStatusTable(self.rx_slices, self.arbiter.target_lane_order)
             logger.info(f"Target Ring->Laser ordering\n{lock_status.display_slice_to_lane}")
             logger.info(f"Target Laser->Ring ordering\n{lock_status.display_lane_to_slice}")
             logger.info(f"Search Table\n{lock_status.get_lock_table()}")
 
-        while self.arbiter.tick():
-            # logger.info("tick")
-            # Update optical signals by propagating wavefronts through the rings downstream
-            self.ring_wdm_row.propagate_wave()
-
-            if plot_snapshot:
-                self.snapshots += [Snapshot(self.sysclk, self.ring_wdm_row, self.arbiter, laser_grid)]
+        # the snapshot check is hoisted out of the tick loop: the loop without snapshots is the Monte-Carlo path
+        arbiter_tick = self.arbiter.tick
+        propagate_wave = self._ring_wdm_row.propagate_wave
+        if plot_snapshot:
+            while arbiter_tick():
+                # Update optical signals by propagating wavefronts through the rings downstream
+                propagate_wave()
+                self.snapshots.append(Snapshot(self.sysclk, self._ring_wdm_row, self.arbiter, laser_grid))
+        else:
+            while arbiter_tick():
+                # Update optical signals by propagating wavefronts through the rings downstream
+                propagate_wave()
 
-        if logger.isEnabledFor(_VERBOSE):
+        if self._verbose:
             lock_status.update_lock_result()
             logger.info(f"Target Ring->Laser ordering\n{lock_status.display_slice_to_lane}")
             logger.info(f"Target Laser->Ring ordering\n{lock_status.display_lane_to_slice}")
@@ -296,7 +330,7 @@ class SystemUnderTest(SimInstance):
 
         # Check if the system has duplicate lock
         if self.is_duplicate_lock():
-            if logger.isEnabledFor(_VERBOSE):
+            if self._verbose:
                 logger.info(f"Duplicate Lock Case: {laser_grid.laser_id}, return with status code 2\n")
                 logger.info(f'Arbiter: {self.arbiter.__class__.__name__}')
                 logger.info(f"\n{text2art('LOCK FAIL')}")
@@ -304,7 +338,7 @@ class SystemUnderTest(SimInstance):
 
         # Check if the arbiter has detected a zero lock case
         if self.arbiter.is_lock_error_state():
-            if logger.isEnabledFor(_VERBOSE):
+            if self._verbose:
                 logger.info(f"Zero Lock Case: {laser_grid.laser_id}, return with status code 1\n")
                 logger.info(f'Arbiter: {self.arbiter.__class__.__name__}')
                 logger.info(f"\n{text2art('LOCK FAIL')}")
@@ -312,7 +346,7 @@ class SystemUnderTest(SimInstance):
 
         if self.arbiter.target_lane_order is not None:
             if not self.is_correct_lane_order():
-                if logger.isEnabledFor(_VERBOSE):
+                if self._verbose:
                     logger.info(f"Wrong Lane Order: {laser_grid.laser_id}, return with status code 3\n")
                     logger.info(f'Arbiter: {self.arbiter.__class__.__name__}')
                     logger.info(f"\n{text2art('LOCK FAIL')}")
@@ -325,7 +359,7 @@ class SystemUnderTest(SimInstance):
             self.relation_distr.read(self.rx_slices)
 
         # return 0 when lock is successful
-        if logger.isEnabledFor(_VERBOSE):
+        if self._verbose:
             logger.info(f"System is locked: {laser_grid.laser_id}, return with status code 0\n")
             logger.info(f'Arbiter: {self.arbiter.__class__.__name__}')
             logger.info(f"\n{text2art('LOCK SUCCESS')}")
@@ -339,37 +373,40 @@ class SystemUnderTest(SimInstance):
 
         :return: True if there is duplicate lock, False otherwise
         """
-        # TODO: find a better way? floating number comparisons are vulnerable to precision errors
-        # collect lock wavelength parameter from all Rx slices tuners and check
-        lock_wavelengths = [rx_slice.tuner.lock_wavelength for rx_slice in self.rx_slices]
-        if logger.isEnabledFor(_VERBOSE):
+        # check the lock wavelengths mirrored from all Rx slices tuners
+        lock_wavelengths = self._lock_wavelengths
+        if self._verbose:
             logger.info(f"lock_wavelengths: {format_wavelengths(lock_wavelengths)}")
-        return len(set(lock_wavelengths)) < len(lock_wavelengths)
+
+        # unlocked tuners are NaN (sorted last): more than one of them counts as a duplicate, as for None values
+        sorted_wavelengths = np.sort(lock_wavelengths)
+        num_locked = np.count_nonzero(~np.isnan(sorted_wavelengths))
+        if lock_wavelengths.shape[0] - num_locked > 1:
+            return True
+
+        # neighbouring lock wavelengths are compared with a relative tolerance rather than by float equality
+        locked = sorted_wavelengths[:num_locked]
+        return bool(np.any(np.diff(locked) < _DUPLICATE_LOCK_TOL_REL * np.abs(locked[:-1])))
 
     def is_correct_lane_order(self) -> bool:
         """Check if the system has correct lane order up to cyclic permutation
+
+        The current lane order maps each slice to the rank of its lock wavelength
+        It is correct if it equals the target lane order shifted by a constant modulo the number of lanes
+        (vertical rotation, i.e., [0, 3, 1, 2] == [1, 0, 2, 3] == [2, 1, 3, 0] == [3, 2, 0, 1])
+        The shift is fixed by the first slice, so only one of the rotations has to be compared,
+        which makes the check O(N log N) (ranking) instead of comparing all the N rotations
         """
-        # TODO: document
-        wavelength_with_index = [(rx_slice.tuner.lock_wavelength, index) for index, rx_slice in enumerate(self.rx_slices)]
-        sorted_by_wavelength = sorted(wavelength_with_index, key=lambda x: x[0])
-        # current_lane_order = [item[1] for item in sorted_by_wavelength]
-
-        current_lane_order = []
-        for item in wavelength_with_index:
-            lane_idx = sorted_by_wavelength.index(item)
-            current_lane_order.append(lane_idx)
-        
-        orig_target_lane_order = self.arbiter.target_lane_order
-        for i in range(len(orig_target_lane_order)):
-            # rotated = self.arbiter.target_lane_order[i:] + self.arbiter.target_lane_order[:i]  # Rotate the correct order
-
-            # vertical rotation matters
-            # i.e., [0, 3, 1, 2] == [1, 0, 2, 3] == [2, 1, 3, 0] == [3, 2, 0, 1]
-            rotated = [(lane_order + i) % len(orig_target_lane_order) for lane_order in orig_target_lane_order]
-            if rotated == current_lane_order:
-                return True  # Found a matching cyclic permutation
-        
-        return False  # No matching cyclic permutation found
+        # current lane order: rank of the lock wavelength of each slice (double argsort)
+        current_lane_order = np.argsort(np.argsort(self._lock_wavelengths, kind='stable'), kind='stable')
+
+        # the only candidate rotation maps the first target lane onto the first current lane
+        target_lane_order = self.arbiter.target_lane_order_arr
+        num_lanes = target_lane_order.shape[0]
+        if num_lanes == 0 or num_lanes != current_lane_order.shape[0]:
+            return False
+        rotation = (current_lane_order[0] - target_lane_order[0]) % num_lanes
+        return bool(np.array_equal((target_lane_order + rotation) % num_lanes, current_lane_order))
     
         # if self.arbiter.target_lane_order is not None:
         #     wavelength_with_index = [(rx_slice.tuner.lock_wavelength, index) for index, rx_slice in enumerate(self.rx_slices)]
@@ -1,9 +1,11 @@
 import logging
-from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from enum import Enum, IntEnum
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from wdmsim.models.laser_grid import LaserGrid
-from wdmsim.models.ring_row import RingRxWDM
+from wdmsim.models.ring_row import RingRxWDM, PORT_IN
 # from wdmsim.models.tuner_policy import (
 #     find_lock_to_least_significant,
 #     find_lock_to_middle,
@@ -18,13 +20,29 @@ from wdmsim.utils.logger import _VERBOSE
 
 logger = logging.getLogger(__name__)
 
+_NAN = float('nan')
+
 
 # TODO: default search_table is set() and lock_code is -1, but this is VERY IMPLICIT at this point
 # refactor so that this becomes explicit and can share with arbiter
 
 # TODO: lock_to_nearest -- make it so that it's only updated when all the tuners are locked (by arbiter)
-# TODO: tuner modes to ENUM?
 # TODO: least_significant -> first? most-signicant -> last?
+class TunerMode(IntEnum):
+    """Lock modes of the tuner, indexing the tuner policies in _LOCK_FNS
+    Tuner.acquire_lock also takes the lowercase member names e.g., "least_significant"
+    """
+    LEAST_SIGNIFICANT = 0
+    NEAREST           = 1
+    MOST_SIGNIFICANT  = 2
+    MIDDLE            = 3
+
+
+# Lock mode lookup by member or by lowercase name
+_TUNER_MODES = {**{tuner_mode: tuner_mode for tuner_mode in TunerMode},
+                **{tuner_mode.name.lower(): tuner_mode for tuner_mode in TunerMode}}
+
+
 class Tuner:
     """Tuner class
     Behavioral model of a tuner with single-ring digital backend and voltage-tuned sweep
@@ -65,6 +83,11 @@ class Tuner:
     LOCK_NO_WAVE        = 6
     LOCK_NOT_IN_RANGE   = 7
 
+    # Lock wavelength array of the system under test that lock_wavelength is mirrored into (NaN when unlocked),
+    # bound by the SUT; None for a standalone tuner
+    _lock_buf = None
+    _lock_idx = 0
+
     def __init__(self) -> None:
         """Constructor
         It defines config/state/master parameters of the tuner and placeholders for the ring 
@@ -73,6 +96,7 @@ class Tuner:
 
         # State variables
         self.search_table              = set()
+        self._code_to_peak_idx         = {}
         self.search_status             = self.SEARCH_NOT_STARTED
         self.lock_status               = self.LOCK_NOT_STARTED
         self.lock_code                 = -1
@@ -86,6 +110,25 @@ class Tuner:
         self.lock_wavelength           = None
         self.lock_wavelength_verbose   = {}
 
+    @property
+    def lock_wavelength(self) -> Optional[float]:
+        """The wavelength that the ring is locked onto, None if unlocked
+        """
+        return self._lock_wavelength
+
+    @lock_wavelength.setter
+    def lock_wavelength(self, wavelength: Optional[float]) -> None:
+        self._lock_wavelength = wavelength
+        if self._lock_buf is not None:
+            self._lock_buf[self._lock_idx] = _NAN if wavelength is None else wavelength
+
+    def _bind(self, lock_buf, idx: int) -> None:
+        """Attach the tuner to a slot of the SUT's lock wavelength array
+        """
+        self._lock_buf = lock_buf
+        self._lock_idx = idx
+        self.lock_wavelength = self._lock_wavelength
+
     """
     Reset functions
     """
@@ -96,6 +139,7 @@ class Tuner:
 
         # Reset State variables
         self.search_table              = set()
+        self._code_to_peak_idx         = {}
         self.search_status             = self.SEARCH_NOT_STARTED
         self.lock_status               = self.LOCK_NOT_STARTED
         self.lock_code                 = -1
@@ -129,19 +173,26 @@ class Tuner:
     """
     Search functions
     """
-    def get_sweep_range(self, ring: RingRxWDM) -> List[List[float]]:
+    def get_sweep_range(self, ring: RingRxWDM) -> np.ndarray:
         """Get the sweep range
         Ideally, the sweep range is the range of wavelengths that the ring can dial in
         It is by nature periodic with the ring fsr extending across the broadband
         Laser grid is defined within a single fsr, so sufficient to return the range by +- fsr
 
+        The range only depends on the ring parameters, so it is cached on the ring
+        and recomputed only when one of them changes
+
         :param ring: The ring to get the sweep range of
-        :return: A list of the sweep range
+        :return: A read-only array of the sweep windows, shape (9, 2) with [min, max] per window
         """
         wavelength = ring.wavelength
         tuning_range = ring.tuning_range
         fsr = ring.fsr
 
+        sweep_range_key = (wavelength, tuning_range, fsr)
+        if ring._sweep_range_key == sweep_range_key:
+            return ring._sweep_range_cache
+
         # TODO: improve? -- how can I remove all the corner cases possible?
         # This causes the sweep range to be the range of wavelengths that the ring can dial in
         # But not enough range to steer away from all the corner cases
@@ -173,7 +224,7 @@ class Tuner:
 
         # change to red-shift only (thermal tuner case)
         # from (wavelength - n * fsr) to (wavelength - n * fsr + tuning_range)
-        return [
+        sweep_range = np.array([
                 [wavelength - 4 * fsr, wavelength - 4 * fsr + tuning_range],
                 [wavelength - 3 * fsr, wavelength - 3 * fsr + tuning_range],
                 [wavelength - 2 * fsr, wavelength - 2 * fsr + tuning_range],
@@ -183,17 +234,24 @@ class Tuner:
                 [wavelength + 2 * fsr, wavelength + 2 * fsr + tuning_range],
                 [wavelength + 3 * fsr, wavelength + 3 * fsr + tuning_range],
                 [wavelength + 4 * fsr, wavelength + 4 * fsr + tuning_range],
-                ]
+                ])
+        sweep_range.flags.writeable = False
+
+        ring._sweep_range_key = sweep_range_key
+        ring._sweep_range_cache = sweep_range
+        return sweep_range
 
     def search_lock(self, ring: RingRxWDM) -> None:
         """Search for a wavelength lock
         :param ring: The ring to search on
         """
-        # Get the sweep range
+        # Get the sweep range, as arrays of the window bounds
         sweep_range = self.get_sweep_range(ring)
+        sweep_lo = sweep_range[:, 0]
+        sweep_hi = sweep_range[:, 1]
 
         # Set target waves to incoming waves of the target ring
-        waves = ring.ports['in'].wave
+        waves = ring.port_list[PORT_IN].wave
 
         # TODO: incoming waves empty implies duplicate lock has happened?
         # TODO: incoming waves meaning the simulator is acting out?!
@@ -208,27 +266,37 @@ class Tuner:
         self.search_data = {}
         self.search_wavelength = {}
         _tmp_search_map = {}
-        for wave_idx, wavelength in enumerate(waves):
-            for sweep in sweep_range:
-                if wavelength >= sweep[0] and wavelength <= sweep[1]:
-                    voltage_code = int((wavelength - sweep[0]) / (sweep[1] - sweep[0]) * (self.VDAC_FS))
-                    # Update main table
-                    self.search_table.add(voltage_code)
-                    # Auxillary data
-                    self.search_data[wave_idx] = voltage_code
-
-                    # Helper variable for ideal arbiter
-                    _tmp_search_map[voltage_code] = wavelength
-                    # # Verbose print
-                    # self.search_wavelength_verbose[voltage_code] = f"{wave_idx} : {wavelength*1e9:.2f} nm"
+
+        # Test every (wave, sweep window) pair in one broadcast and only visit the hits in python
+        # np.nonzero walks the hits in (wave_idx, sweep window) order, same as a nested loop would
+        wl_arr = waves._wl
+        in_sweep = (wl_arr[:, None] >= sweep_lo) & (wl_arr[:, None] <= sweep_hi)
+        hit_wave_idx, hit_sweep_idx = np.nonzero(in_sweep)
+        hit_wl = wl_arr[hit_wave_idx]
+        hit_lo = sweep_lo[hit_sweep_idx]
+        hit_code = ((hit_wl - hit_lo) / (sweep_hi[hit_sweep_idx] - hit_lo) * self.VDAC_FS).astype(np.int64)
+
+        for wave_idx, voltage_code, wavelength in zip(hit_wave_idx.tolist(), hit_code.tolist(), hit_wl.tolist()):
+            # Update main table
+            self.search_table.add(voltage_code)
+            # Auxillary data
+            self.search_data[wave_idx] = voltage_code
+
+            # Helper variable for ideal arbiter
+            _tmp_search_map[voltage_code] = wavelength
+            # # Verbose print
+            # self.search_wavelength_verbose[voltage_code] = f"{wave_idx} : {wavelength*1e9:.2f} nm"
 
         # Helper variable for ideal arbiter
         # Convert from {voltage_code: wavelength} to {peak_idx: wavelength} 
         # where idx is the index of the voltage code in the sorted list of voltage codes
         # self.search_wavelength = {peak_idx: _tmp_search_map[voltage_code] for peak_idx, voltage_code in enumerate(sorted(self.search_table))}
+        sorted_search_table = sorted(self.search_table)
         self.search_wavelength = {peak_idx: {'code': voltage_code, 'wavelength':
                                              _tmp_search_map[voltage_code]} 
-                                             for peak_idx, voltage_code in enumerate(sorted(self.search_table))}
+                                             for peak_idx, voltage_code in enumerate(sorted_search_table)}
+        # Inverse map for get_lock_idx
+        self._code_to_peak_idx = {voltage_code: peak_idx for peak_idx, voltage_code in enumerate(sorted_search_table)}
 
         # Set search status
         if self.search_data: 
@@ -251,7 +319,7 @@ class Tuner:
     """
     Lock acquire/release functions
     """
-    def acquire_lock(self, ring: RingRxWDM, mode: str, select: int) -> None:
+    def acquire_lock(self, ring: RingRxWDM, mode: Union[str, TunerMode], select: int) -> None:
         """Search and Lock onto a wavelength
         Behavioral model of a tuner performing both lock search and lock-to-maximum track
         It chooses the wavelength from the search data and mode/select configuration
@@ -268,11 +336,12 @@ class Tuner:
         lock-to-middle          = "middle",             0
 
         :param ring: The ring to lock on
-        :param mode: The mode of lock
+        :param mode: The mode of lock, a TunerMode or its lowercase name
         :param select: The select index of lock
         """
         # Assert that the mode and select are valid
-        assert mode in ["least_significant", "nearest", "most_significant", "middle"], "Invalid mode"
+        lock_mode = _TUNER_MODES.get(mode)
+        assert lock_mode is not None, "Invalid mode"
         assert select >= 0, "Select must be a positive integer"
 
         # Set lock status to the same value as search status if search is unsuccessful (status > 0)
@@ -290,15 +359,7 @@ class Tuner:
 
         # If search status is 0 (search complete), lock to the wavelength
         # lock to one of the wavelengths of incoming waves based on the mode
-        do_lock = {
-            "least_significant": find_lock_to_least_significant,
-            "nearest": find_lock_to_nearest,
-            "most_significant": find_lock_to_most_significant,
-            "middle": find_lock_to_middle,
-            }    
-
-        # wave_idx, voltage_code = do_lock[mode](self, select)
-        lock_table_entry = do_lock[mode](self, select)
+        lock_table_entry = _LOCK_FNS[lock_mode](self, select)
         if lock_table_entry is None:
             # if the function finds nothing, just return
             if logger.isEnabledFor(_VERBOSE):
@@ -317,7 +378,7 @@ class Tuner:
         self.lock_code = voltage_code
 
         # Set lock wavelength from the wave idx of the lock data
-        self.lock_wavelength = ring.ports['in'].wave[wave_idx]
+        self.lock_wavelength = ring.port_list[PORT_IN].wave[wave_idx]
 
         # Tune the ring to the lock wavelength
         ring.acquire_lock_by_wave_idx(wave_idx)
@@ -406,7 +467,7 @@ class Tuner:
 
     def get_lock_idx(self) -> int:
         assert self.lock_status == self.LOCK_DONE, "Tuner is not locked"
-        return sorted(self.search_table).index(self.get_lock_voltage_code())
+        return self._code_to_peak_idx[self.lock_code]
 
 
     """
@@ -417,11 +478,7 @@ class Tuner:
         :return: True if the wavelength is within the search range, False otherwise
         """
         sweep_range = self.get_sweep_range(ring)
-        for sweep in sweep_range:
-            if wavelength >= sweep[0] and wavelength <= sweep[1]:
-                return True
-        else:
-            return False
+        return bool(np.any((wavelength >= sweep_range[:, 0]) & (wavelength <= sweep_range[:, 1])))
 
 """
 Tuner Policies
@@ -549,3 +606,10 @@ def find_lock_to_middle(tuner: Tuner, select: int) -> Optional[Tuple[int, int]]:
     return sorted_search_data[select]
 
 
+# Tuner policies indexed by TunerMode
+_LOCK_FNS = (
+    find_lock_to_least_significant,
+    find_lock_to_nearest,
+    find_lock_to_most_significant,
+    find_lock_to_middle,
+    )
@@ -11,10 +11,12 @@ import multiprocessing
 import os
 from pathlib import Path
 import pstats
+import random
 import sys
 from itertools import product
 from typing import Any, NamedTuple, Optional, Tuple, Union, List
 
+import numpy
 import pandas as pd
 # import tabulate
 
@@ -184,6 +186,93 @@ def run_experiment(
     return sim_outputs
 
 
+def _run_experiment_seeded(seed: int, *args) -> SimulatorOutputs:
+    """run_experiment in a pool worker, with the global RNGs seeded first
+    Forked workers inherit the RNG state of the parent, and would otherwise draw the same laser/ring samples;
+    the seed is drawn from the parent RNG, so a run the caller seeded stays reproducible over the pool
+
+    :param seed: seed of the global RNGs (random and numpy.random) of the worker
+    :param args: run_experiment arguments
+    """
+    random.seed(seed)
+    numpy.random.seed(seed)
+    return run_experiment(*args)
+
+
+def _merge_experiment_outputs(outputs: List[SimulatorOutputs]) -> SimulatorOutputs:
+    """Merge the outputs of experiments run on the same design parameters into a single output
+    Counts are summed and the failure rates are recomputed over all the experiments
+    """
+    counts = {
+        key: sum(output.result[key] for output in outputs)
+        for key in ['num_success', 'num_failure', 'num_zero_lock', 'num_duplicate_lock', 'num_wrong_lane_order']
+    }
+    num_experiments = counts['num_success'] + counts['num_failure']
+    result = {
+        **counts,
+        'failure_in_time': counts['num_failure'] / num_experiments,
+        'failure_zero_lock': counts['num_zero_lock'] / num_experiments,
+        'failure_duplicate_lock': counts['num_duplicate_lock'] / num_experiments,
+        'failure_wrong_lane_order': counts['num_wrong_lane_order'] / num_experiments,
+    }
+    return outputs[0]._replace(result=result)
+
+
+def run_experiment_parallel(
+    laser_design_params: LaserDesignParams,
+    ring_design_params: RingDesignParams,
+    init_lane_order_params: LaneOrderParams,
+    tgt_lane_order_params: LaneOrderParams,
+    arbiter_of_choice: str,
+    num_laser_swaps: int,
+    num_ring_swaps: int,
+    nprocs: int,
+) -> SimulatorOutputs:
+    """Run experiment over a process pool
+
+    The ring swaps are independent Monte-Carlo samples (each rebuilds the system under test),
+    so they are split into one share per process, run with run_experiment and merged
+    The laser swaps of a ring swap stay in the same process since they share the ring row
+
+    :param nprocs: number of processes, -1 for all available processors
+    :return: simulator outputs
+    :rtype: SimulatorOutputs
+    """
+    if nprocs == -1:
+        nprocs = multiprocessing.cpu_count()
+    elif nprocs < 1:
+        raise ValueError(f"nprocs should be -1 or >= 1. nprocs = {nprocs}")
+
+    if num_laser_swaps < 1:
+        raise ValueError(f"num_laser_swaps should be >= 1. num_laser_swaps = {num_laser_swaps}")
+    if num_ring_swaps < 1:
+        raise ValueError(f"num_ring_swaps should be >= 1. num_ring_swaps = {num_ring_swaps}")
+
+    # split the ring swaps as evenly as possible over the processes
+    num_shares = min(nprocs, num_ring_swaps)
+
+    # a single share is not worth a pool
+    if num_shares == 1:
+        return run_experiment(laser_design_params, ring_design_params, init_lane_order_params, tgt_lane_order_params,
+                              arbiter_of_choice, num_laser_swaps, num_ring_swaps)
+
+    ring_swap_shares = [num_ring_swaps // num_shares + (share_idx < num_ring_swaps % num_shares)
+                        for share_idx in range(num_shares)]
+
+    # one seed per share, drawn in share order from the parent RNG
+    seeds = [random.getrandbits(32) for _ in ring_swap_shares]
+
+    with multiprocessing.Pool(processes=num_shares) as pool:
+        outputs = pool.starmap(
+            _run_experiment_seeded,
+            [(seed, laser_design_params, ring_design_params, init_lane_order_params, tgt_lane_order_params,
+              arbiter_of_choice, num_laser_swaps, ring_swap_share)
+             for seed, ring_swap_share in zip(seeds, ring_swap_shares)],
+        )
+
+    return _merge_experiment_outputs(outputs)
+
+
 def run_compare(
     laser_design_params: LaserDesignParams,
     ring_design_params: RingDesignParams,
@@ -493,6 +582,7 @@ def run(
     tgt_lane_order_config_section,
     results_dir,
     verbose,
+    nprocs=1,
 ):
     """
     run function
@@ -563,15 +653,28 @@ def run(
     logging.info(str_print("Experiment Start"))
     logging.info(pad_print())
 
-    sim_outputs = run_experiment(
-        laser_design_params, 
-        ring_design_params, 
-        init_lane_order_params,
-        tgt_lane_order_params,
-        arbiter, 
-        num_laser_swaps, 
-        num_ring_swaps,
-    )
+    if nprocs == 1:
+        sim_outputs = run_experiment(
+            laser_design_params, 
+            ring_design_params, 
+            init_lane_order_params,
+            tgt_lane_order_params,
+            arbiter, 
+            num_laser_swaps, 
+            num_ring_swaps,
+        )
+    else:
+        sim_outputs = run_experiment_parallel(
+            laser_design_params, 
+            ring_design_params, 
+            init_lane_order_params,
+            tgt_lane_order_params,
+            arbiter, 
+            num_laser_swaps, 
+            num_ring_swaps,
+            nprocs,
+        )
+        logging.info(f"[Experiment] merged over the process pool: {sim_outputs.result}")
 
     # log experiment end
     logging.info(pad_print())
@@ -1,4 +1,6 @@
 
+import logging
+import random
 from typing import List, NamedTuple, Optional
 
 import numpy 
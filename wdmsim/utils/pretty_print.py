@@ -88,8 +88,11 @@ def print_run_header(
 
 def format_wavelengths(wavelengths: list, fmt: str = '.2f', scale: int = 1e9) -> str:
     """Format list of wavelengths for printing
-
+    A float array is also accepted, its NaN entries (unlocked tuners) are shown as None
     """
+    if hasattr(wavelengths, 'tolist'):
+        wavelengths = [None if wavelength != wavelength else wavelength for wavelength in wavelengths.tolist()]
+
     formatted_wavelengths = []
     for wavelength in wavelengths:
         if type(wavelength) == float: